@@ -0,0 +1,302 @@
+"""
+SQLite storage for the day5 contact book (stdlib sqlite3).
+
+Same interface as ContactStore, so the menu works with either, but the
+book lives on disk and nothing is loaded at startup: every call is a
+query against an index.
+
+  contacts      unique indexes on name and number -> lookups by normalized
+                name and number, A-Z straight off the name index
+  contact_fts   FTS5 trigram index over the names (when the SQLite build
+                has it) for substring search; otherwise a scan with instr()
+
+Inserts are batched: add_many() writes a whole batch in one transaction
+and indexes the new names in the FTS table with a single INSERT..SELECT.
+import_csv() / import_vcard() stream a file in batches; files bigger than
+one batch are loaded with the unique indexes dropped and rebuilt after.
+
+  python contact_db.py contacts.db import book.csv
+  python contact_db.py contacts.db import book.vcf
+"""
+
+import argparse
+import csv
+import os
+import re
+import sqlite3
+import time
+from itertools import chain, islice
+
+from contact_store import normalize_name
+
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "contacts.db")
+BATCH   = 50_000
+NUMBER_DIGITS = 10
+NUMBER_PREFIXES = ("", "0", "91", "091", "0091")   # none, trunk 0, country code +91 / 0091
+NON_DIGITS = re.compile(r"\D+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    name   TEXT NOT NULL,
+    number TEXT NOT NULL
+);
+"""
+INDEXES = ("CREATE UNIQUE INDEX IF NOT EXISTS contacts_name   ON contacts (name)",
+           "CREATE UNIQUE INDEX IF NOT EXISTS contacts_number ON contacts (number)")
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS contact_fts
+    USING fts5(name, content='contacts', content_rowid='rowid', tokenize='trigram');
+"""
+
+
+def valid_name(name):
+    return name != "" and name.replace(" ", "").isalpha()
+
+
+def clean_number(raw_number):
+    """
+    The 10 digits of a number, or None.  Separators are ignored and a
+    recognised country / trunk prefix (NUMBER_PREFIXES) is dropped; any
+    other length or prefix (extensions, foreign numbers) is rejected.
+    """
+    digits = raw_number if raw_number.isdigit() else NON_DIGITS.sub("", raw_number)
+    if len(digits) < NUMBER_DIGITS or digits[:-NUMBER_DIGITS] not in NUMBER_PREFIXES:
+        return None
+    return digits[-NUMBER_DIGITS:]
+
+
+def clean_rows(rows):
+    """(raw name, raw number) -> normalized (name, number); invalid rows are dropped"""
+    for raw_name, raw_number in rows:
+        name, number = normalize_name(raw_name), clean_number(raw_number)
+        if number is not None and valid_name(name):
+            yield name, number
+
+
+class ContactDB:
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+            for statement in INDEXES:
+                self.conn.execute(statement)
+            try:
+                self.conn.executescript(FTS_SCHEMA)
+                self.fts = True
+            except sqlite3.OperationalError:   # SQLite without FTS5 / trigram (< 3.34)
+                self.fts = False
+
+    def close(self):
+        self.conn.close()
+
+    def _one(self, sql, *args):
+        row = self.conn.execute(sql, args).fetchone()
+        return row[0] if row else None
+
+    def __len__(self):
+        return self._one("SELECT COUNT(*) FROM contacts")
+
+    def __bool__(self):
+        return self._one("SELECT 1 FROM contacts LIMIT 1") is not None
+
+    def __contains__(self, name):
+        return self._one("SELECT 1 FROM contacts WHERE name = ?", name) is not None
+
+    def get(self, name):
+        return self._one("SELECT number FROM contacts WHERE name = ?", name)
+
+    def name_for_number(self, number):
+        return self._one("SELECT name FROM contacts WHERE number = ?", number)
+
+    def has_number(self, number):
+        return self._one("SELECT 1 FROM contacts WHERE number = ?", number) is not None
+
+    # ─────────────────────────────────────────
+    #  CHANGES
+    # ─────────────────────────────────────────
+    def add(self, name, number):
+        """Add a normalized name; ValueError if the name or number is taken."""
+        if name in self:
+            raise ValueError(f"Name already present: {name}")
+        owner = self.name_for_number(number)
+        if owner is not None:
+            raise ValueError(f"Number already assigned to {owner}")
+        self.add_many([(name, number)])
+
+    def add_many(self, contacts):
+        """Insert (name, number) pairs in one transaction; taken names/numbers are skipped."""
+        with self.conn:
+            last = self._one("SELECT IFNULL(MAX(rowid), 0) FROM contacts")
+            before = self.conn.total_changes
+            self.conn.executemany("INSERT OR IGNORE INTO contacts (name, number) VALUES (?, ?)", contacts)
+            added = self.conn.total_changes - before
+            if self.fts and added:
+                self.conn.execute("INSERT INTO contact_fts (rowid, name) "
+                                  "SELECT rowid, name FROM contacts WHERE rowid > ? ORDER BY rowid", (last,))
+        return added
+
+    def remove(self, name):
+        with self.conn:
+            row = self.conn.execute("SELECT rowid, number FROM contacts WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                raise KeyError(name)
+            if self.fts:
+                self.conn.execute("INSERT INTO contact_fts (contact_fts, rowid, name) "
+                                  "VALUES ('delete', ?, ?)", (row[0], name))
+            self.conn.execute("DELETE FROM contacts WHERE rowid = ?", (row[0],))
+        return row[1]
+
+    # ─────────────────────────────────────────
+    #  QUERIES
+    # ─────────────────────────────────────────
+    def items(self):
+        """(name, number) in A-Z order, streamed off the name index"""
+        return self.conn.execute("SELECT name, number FROM contacts ORDER BY name")
+
+    def prefix(self, query):
+        """Names starting with query, A-Z"""
+        rows = self.conn.execute("SELECT name FROM contacts WHERE name >= ? AND name < ? ORDER BY name",
+                                 (query, query + "\uffff"))
+        return [name for name, in rows]
+
+    def search(self, query):
+        """Names containing query, A-Z"""
+        if self.fts and len(query) >= 3:
+            phrase = '"' + query.replace('"', '""') + '"'
+            rows = self.conn.execute("SELECT c.name FROM contact_fts JOIN contacts c ON c.rowid = contact_fts.rowid "
+                                     "WHERE contact_fts MATCH ? ORDER BY c.name", (phrase,))
+        else:
+            rows = self.conn.execute("SELECT name FROM contacts WHERE instr(name, ?) > 0 ORDER BY name", (query,))
+        return [name for name, in rows]
+
+    # ─────────────────────────────────────────
+    #  BULK IMPORT
+    # ─────────────────────────────────────────
+    def import_rows(self, rows, batch=BATCH):
+        """
+        rows of (raw name, raw number) -> (added, skipped).
+        Up to one batch goes through add_many().  Bigger imports run in one
+        transaction with the unique indexes dropped: rows are checked against
+        the names and numbers already seen, appended, and the indexes are
+        rebuilt with one sort instead of a random B-tree insert per row.
+        """
+        rows  = iter(rows)
+        first = list(islice(rows, batch))
+        if len(first) < batch:
+            added = self.add_many(list(clean_rows(first)))
+            return added, len(first) - added
+        return self._bulk_import(chain(first, rows), batch)
+
+    def _bulk_import(self, rows, batch):
+        names, numbers = set(), set()
+        for name, number in self.conn.execute("SELECT name, number FROM contacts"):
+            names.add(name)
+            numbers.add(number)
+
+        added = skipped = 0
+        with self.conn:
+            self.conn.execute("BEGIN")        # DROP INDEX would otherwise commit on its own
+            last = self._one("SELECT IFNULL(MAX(rowid), 0) FROM contacts")
+            self.conn.execute("DROP INDEX contacts_name")
+            self.conn.execute("DROP INDEX contacts_number")
+            while True:
+                raw = list(islice(rows, batch))
+                if not raw:
+                    break
+                chunk = []
+                for name, number in clean_rows(raw):
+                    if name not in names and number not in numbers:
+                        names.add(name)
+                        numbers.add(number)
+                        chunk.append((name, number))
+                self.conn.executemany("INSERT INTO contacts (name, number) VALUES (?, ?)", chunk)
+                added   += len(chunk)
+                skipped += len(raw) - len(chunk)
+            for statement in INDEXES:
+                self.conn.execute(statement)
+            if self.fts and added:
+                # in rowid order: FTS5 is many times slower fed out-of-order rowids
+                self.conn.execute("INSERT INTO contact_fts (rowid, name) "
+                                  "SELECT rowid, name FROM contacts WHERE rowid > ? ORDER BY rowid", (last,))
+        return added, skipped
+
+    def import_csv(self, path, batch=BATCH):
+        return self.import_rows(csv_rows(path), batch)
+
+    def import_vcard(self, path, batch=BATCH):
+        return self.import_rows(vcard_rows(path), batch)
+
+
+def csv_rows(path):
+    """(name, number) from a csv with name / number (or phone, tel) columns, or two bare columns"""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        first = next(reader, None)
+        if first is None:
+            return
+        header = [h.strip().lower() for h in first]
+        if "name" in header:
+            name_col   = header.index("name")
+            number_col = next((header.index(h) for h in ("number", "phone", "tel") if h in header), None)
+            if number_col is None:
+                raise ValueError(f"{path}: no number / phone / tel column")
+        else:
+            name_col, number_col = 0, 1
+            yield first[name_col], first[number_col]
+        for row in reader:
+            if len(row) > max(name_col, number_col):
+                yield row[name_col], row[number_col]
+
+
+def vcard_rows(path):
+    """(FN, first TEL) of every card in a .vcf; folded lines are joined"""
+    name = number = None
+    with open(path, encoding="utf-8") as f:
+        lines = iter(f)
+        line = next(lines, None)
+        while line is not None:
+            line = line.rstrip("\r\n")
+            following = next(lines, None)
+            while following is not None and following[:1] in (" ", "\t"):
+                line += following.rstrip("\r\n")[1:]
+                following = next(lines, None)
+
+            key, _, value = line.partition(":")
+            field = key.split(";")[0].upper()
+            if field == "BEGIN":
+                name = number = None
+            elif field == "FN":
+                name = value
+            elif field == "TEL" and number is None:
+                number = value
+            elif field == "END" and name is not None and number is not None:
+                yield name, number
+            line = following
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Contact book database tools")
+    parser.add_argument("db", nargs="?", default=DB_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", help="bulk import a .csv or .vcf file")
+    imp.add_argument("file")
+    imp.add_argument("--batch", type=int, default=BATCH)
+    args = parser.parse_args()
+
+    db = ContactDB(args.db)
+    start = time.perf_counter()
+    if args.file.lower().endswith((".vcf", ".vcard")):
+        added, skipped = db.import_vcard(args.file, args.batch)
+    else:
+        added, skipped = db.import_csv(args.file, args.batch)
+    elapsed = time.perf_counter() - start
+    print(f"{added:,} contacts added, {skipped:,} skipped in {elapsed:.2f} s "
+          f"({(added + skipped) / elapsed:,.0f} rows/s) -> {len(db):,} in {args.db}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Indexed contact storage for the day5 contact book.
+
+  by name    dict name -> number
+  by number  dict number -> name          (duplicate-number check is O(1))
+  trigrams   trigram -> array of name ids (substring search only checks
+             names sharing the query's rarest trigram)
+  sorted     names kept in order with bisect, so "View A-Z" and prefix
+             search never sort the whole book again
+
+Deleted names leave a tombstone in the trigram postings; the index is
+rebuilt once tombstones outnumber live names.
+"""
+
+from array import array
+from bisect import bisect_left, insort
+
+
+def normalize_name(raw_name):
+    """Lower case, single spaces: the form names are stored and searched in."""
+    return " ".join(raw_name.strip().split()).lower()
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class ContactStore:
+    def __init__(self, contacts=None):
+        self._numbers = {}      # name -> number
+        self._names   = {}      # number -> name
+        self._ids     = {}      # name -> id in _by_id
+        self._by_id   = []      # id -> name, None once deleted
+        self._grams   = {}      # trigram -> array of ids
+        self._sorted  = []
+        if contacts:
+            self.add_many(contacts)
+
+    def __len__(self):
+        return len(self._numbers)
+
+    def __contains__(self, name):
+        return name in self._numbers
+
+    def get(self, name):
+        return self._numbers.get(name)
+
+    def name_for_number(self, number):
+        return self._names.get(number)
+
+    def has_number(self, number):
+        return number in self._names
+
+    # ─────────────────────────────────────────
+    #  CHANGES
+    # ─────────────────────────────────────────
+    def _index(self, name):
+        contact_id = len(self._by_id)
+        self._by_id.append(name)
+        self._ids[name] = contact_id
+        for gram in trigrams(name):
+            postings = self._grams.get(gram)
+            if postings is None:
+                postings = self._grams[gram] = array("I")
+            postings.append(contact_id)
+
+    def add(self, name, number):
+        """Add a normalized name; ValueError if the name or number is taken."""
+        if name in self._numbers:
+            raise ValueError(f"Name already present: {name}")
+        if number in self._names:
+            raise ValueError(f"Number already assigned to {self._names[number]}")
+        self._numbers[name] = number
+        self._names[number] = name
+        self._index(name)
+        insort(self._sorted, name)
+
+    def add_many(self, contacts):
+        """Bulk add (name, number) pairs; the sorted index is rebuilt once."""
+        added = []
+        for name, number in contacts:
+            if name in self._numbers or number in self._names:
+                continue
+            self._numbers[name] = number
+            self._names[number] = name
+            self._index(name)
+            added.append(name)
+        self._sorted.extend(added)
+        self._sorted.sort()
+        return len(added)
+
+    def remove(self, name):
+        number = self._numbers.pop(name)
+        del self._names[number]
+        self._by_id[self._ids.pop(name)] = None
+        del self._sorted[bisect_left(self._sorted, name)]
+        if len(self._by_id) > 2 * len(self._ids) + 1024:
+            self._reindex()
+        return number
+
+    def _reindex(self):
+        """Drop tombstones: renumber the live names and rebuild the postings."""
+        self._ids.clear()
+        self._by_id = []
+        self._grams = {}
+        for name in self._sorted:
+            self._index(name)
+
+    # ─────────────────────────────────────────
+    #  QUERIES
+    # ─────────────────────────────────────────
+    def items(self):
+        """(name, number) in A-Z order"""
+        return ((name, self._numbers[name]) for name in self._sorted)
+
+    def prefix(self, query):
+        """Names starting with query, A-Z"""
+        start = bisect_left(self._sorted, query)
+        end   = bisect_left(self._sorted, query + "\uffff")
+        return self._sorted[start:end]
+
+    def search(self, query):
+        """Names containing query, A-Z"""
+        grams = trigrams(query)
+        if not grams:
+            # 1-2 characters match a large part of the book anyway
+            return [name for name in self._sorted if query in name]
+        postings = [self._grams.get(gram) for gram in grams]
+        if any(p is None for p in postings):
+            return []
+        rarest = min(postings, key=len)
+        by_id  = self._by_id
+        return sorted(name for name in (by_id[i] for i in rarest)
+                      if name is not None and query in name)
@@ -0,0 +1,94 @@
+"""
+Contact book at scale: the plain dict the menu used to keep vs ContactStore.
+
+For 10k, 100k and 1M generated contacts times the operations the menu
+runs: the duplicate-number check on add, substring search, delete by
+substring and listing A-Z.  The dict side does what the old menu did
+(contact.values() scan, loop over every name, sorted() per view).
+
+Run from Day5: python day5-contact-benchmark.py [sizes...]
+"""
+
+import random
+import sys
+import time
+
+from contact_store import ContactStore
+
+SIZES    = [10_000, 100_000, 1_000_000]
+QUERIES  = 20
+SYLLABLES = ["ka", "ri", "mo", "an", "sh", "ta", "ne", "vi", "ra", "lu", "pe", "di", "so", "ar", "ya", "el"]
+
+
+def make_contacts(n, seed=5):
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < n:
+        first = "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4)))
+        last  = "".join(rng.choices(SYLLABLES, k=rng.randint(2, 5)))
+        names.add(f"{first} {last}")
+    numbers = rng.sample(range(6_000_000_000, 10_000_000_000), n)
+    return list(zip(sorted(names, key=lambda _: rng.random()), map(str, numbers)))
+
+
+def per_call_ms(fn, args):
+    start = time.perf_counter()
+    for a in args:
+        fn(a)
+    return (time.perf_counter() - start) / len(args) * 1000
+
+
+def run(n):
+    contacts = make_contacts(n)
+    rng      = random.Random(n)
+    picked   = rng.sample(contacts, QUERIES)
+    queries  = [name[i:i + 4] for name, _ in picked for i in [rng.randrange(len(name) - 3)]]
+    numbers  = [number for _, number in picked] + ["5" + str(rng.randrange(10**9)).zfill(9) for _ in range(QUERIES)]
+
+    start = time.perf_counter()
+    plain = dict(contacts)
+    plain_load = time.perf_counter() - start
+    start = time.perf_counter()
+    store = ContactStore(contacts)
+    store_load = time.perf_counter() - start
+
+    rows = [
+        ("load (s)",        plain_load, store_load),
+        ("number check",    per_call_ms(lambda num: num in plain.values(), numbers),
+                            per_call_ms(store.has_number, numbers)),
+        ("substring search", per_call_ms(lambda q: [name for name in plain if q in name], queries),
+                            per_call_ms(store.search, queries)),
+        ("view A-Z",        per_call_ms(lambda _: [(name, plain[name]) for name in sorted(plain)], range(3)),
+                            per_call_ms(lambda _: list(store.items()), range(3))),
+    ]
+
+    # delete: search, then remove the first match (as the menu does)
+    def plain_delete(q):
+        matches = [name for name in plain if q in name]
+        if matches:
+            del plain[matches[0]]
+
+    def store_delete(q):
+        matches = store.search(q)
+        if matches:
+            store.remove(matches[0])
+
+    rows.append(("delete", per_call_ms(plain_delete, queries), per_call_ms(store_delete, queries)))
+    assert len(plain) == len(store)
+
+    print(f"\n{n:,} contacts")
+    print(f"  {'operation':<17} | {'dict':>10} | {'store':>10} | {'speedup':>8}")
+    print("  " + "-" * 54)
+    for name, old, new in rows:
+        unit = "" if name.endswith("(s)") else " ms"
+        print(f"  {name:<17} | {old:>7.3f}{unit or '   '} | {new:>7.3f}{unit or '   '} | {old / new:>7.1f}x")
+
+
+def main():
+    sizes = [int(s) for s in sys.argv[1:]] or SIZES
+    for n in sizes:
+        run(n)
+
+
+if __name__ == "__main__":
+    main()
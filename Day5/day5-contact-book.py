@@ -1,5 +1,10 @@
+import sys
 
-contact={}
+from contact_db import DB_PATH, ContactDB
+from contact_store import normalize_name
+
+# Saved in contacts.db next to this script, or the path given on the command line
+contact = ContactDB(sys.argv[1] if len(sys.argv) > 1 else DB_PATH)
 
 while True:
     print("1. Add Contact")
@@ -14,7 +19,7 @@ while True:
         case 1:
             #contactName = input("Enter Contact Name : ").strip().lower() 
             raw_name = input("Enter Contact Name: ")
-            contactName = " ".join(raw_name.strip().split()).lower()
+            contactName = normalize_name(raw_name)
             contactNumber = input("Enter Contact Number ").strip()
 
             if contactName == "":
@@ -26,13 +31,13 @@ while True:
             elif contactName in contact:
                 print("\n Name already Present \n")
 
-            elif contactNumber in contact.values():
+            elif contact.has_number(contactNumber):
                 print("\n This number is already assigned to another contact! \n ")
             
             elif len(contactNumber) != 10 or not contactNumber.isdigit():
                 print("\n Enter a Valid Number \n")
             else:
-                contact[contactName] = contactNumber
+                contact.add(contactName, contactNumber)
                 print("\n Contact added  Sucessfully \n")
                 
 
@@ -44,8 +49,8 @@ while True:
             else:
                 print("\n-------------Contact List A-Z------------\n")
 
-                for name in sorted(contact):
-                    print(name.title(), " : ",contact[name])
+                for name, number in contact.items():
+                    print(name.title(), " : ",number)
 
         case 3:
             if not contact:
@@ -53,22 +58,20 @@ while True:
 
             else:
                 raw_name = input("Enter Contact Name: ")
-                search = " ".join(raw_name.strip().split()).lower()
+                search = normalize_name(raw_name)
                 
                 if search == "":
                     print("Enter something to search.")
                 elif not search.replace(" ", "").isalpha():
                     print("Search should contain only letters and spaces.")
                 else:
-                    found = False
+                    matches = contact.search(search)  # partial match
                     print("\n---- Search Results ----\n")
 
-                    for name, number in contact.items():
-                        if search in name:  # partial match
-                            print(name.title(), ":", number)
-                            found = True
+                    for name in matches:
+                        print(name.title(), ":", contact.get(name))
 
-                    if not found:
+                    if not matches:
                         print("No matching contacts found.")
         case 4:
             if not contact:
@@ -76,37 +79,34 @@ while True:
 
             else:
                 raw_name = input("Enter Contact Name to delete: ")
-                search = " ".join(raw_name.strip().split()).lower()
+                search = normalize_name(raw_name)
                 
                 if search == "":
                     print("Enter something to delete.")
                 elif not search.replace(" ", "").isalpha():
                     print("Name should contain only letters and spaces.")
                 else:
-                    matches = []
-                    for name in contact:
-                        if search in name:
-                            matches.append(name)
+                    matches = contact.search(search)
 
                     if not matches:
                         print("No Matching contact found to delete")
 
                     elif len(matches) == 1:
                         name_to_delete = matches[0]
-                        del contact[name_to_delete]
+                        contact.remove(name_to_delete)
                         print(f"Deleted: {name_to_delete.title()}")
 
                     else:
                         print("\n ------Multiple Matches Found-------")
 
                         for i, name in enumerate(matches, start=1):
-                            print(f"{i}. {name.title()} : {contact[name]}")
+                            print(f"{i}. {name.title()} : {contact.get(name)}")
 
                         try:
                             idx = int(input("Enter number to delete: "))
                             if 1 <= idx <= len(matches):
                                 name_to_delete = matches[idx - 1]
-                                del contact[name_to_delete]
+                                contact.remove(name_to_delete)
                                 print(f"Deleted: {name_to_delete.title()}")
                             else:
                                 print("\nInvalid selection\n")
@@ -116,6 +116,7 @@ while True:
 
         case 5:
             print("Exiting...")
+            contact.close()
             break
         case _:
             print("Invalid choice. Try again.")
@@ -0,0 +1,102 @@
+"""
+ContactDB on disk: bulk import, startup and lookup cost by book size.
+
+Writes generated books as .csv and .vcf, imports them into a fresh
+database, then reopens it (the menu's startup) and times the lookups
+the menu makes: name, duplicate number, substring search, and the first
+page of View A-Z.
+
+Run from Day5: python day5-contactdb-benchmark.py [sizes...]
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+from contact_db import ContactDB
+
+SIZES     = [10_000, 100_000, 1_000_000]
+QUERIES   = 50
+PAGE      = 20
+SYLLABLES = ["ka", "ri", "mo", "an", "sh", "ta", "ne", "vi", "ra", "lu", "pe", "di", "so", "ar", "ya", "el"]
+
+
+def make_contacts(n, seed=5):
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < n:
+        first = "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4)))
+        last  = "".join(rng.choices(SYLLABLES, k=rng.randint(2, 5)))
+        names.add(f"{first.title()} {last.title()}")
+    numbers = rng.sample(range(6_000_000_000, 10_000_000_000), n)
+    return list(zip(sorted(names, key=lambda _: rng.random()), map(str, numbers)))
+
+
+def write_csv(path, contacts):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        out = csv.writer(f)
+        out.writerow(["name", "phone"])
+        out.writerows((name, "+91 " + number) for name, number in contacts)
+
+
+def write_vcard(path, contacts):
+    with open(path, "w", encoding="utf-8") as f:
+        for name, number in contacts:
+            f.write(f"BEGIN:VCARD\nVERSION:3.0\nFN:{name}\nTEL;TYPE=CELL:{number}\nEND:VCARD\n")
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def per_call_ms(fn, args):
+    start = time.perf_counter()
+    for a in args:
+        fn(a)
+    return (time.perf_counter() - start) / len(args) * 1000
+
+
+def run(n, workdir):
+    contacts = make_contacts(n)
+    rng      = random.Random(n)
+    picked   = rng.sample(contacts, QUERIES)
+    names    = [name.lower() for name, _ in picked]
+    numbers  = [number for _, number in picked]
+    queries  = [name[i:i + 4] for name in names for i in [rng.randrange(len(name) - 3)]]
+
+    csv_path, vcf_path = os.path.join(workdir, f"{n}.csv"), os.path.join(workdir, f"{n}.vcf")
+    write_csv(csv_path, contacts)
+    write_vcard(vcf_path, contacts)
+
+    print(f"\n{n:,} contacts")
+    for label, path, load in [("csv", csv_path, ContactDB.import_csv), ("vcard", vcf_path, ContactDB.import_vcard)]:
+        db_path = os.path.join(workdir, f"{n}-{label}.db")
+        db = ContactDB(db_path)
+        seconds, (added, skipped) = timed(load, db, path)
+        db.close()
+        print(f"  import {label:<6} {seconds:>7.2f} s  {added / seconds:>10,.0f} contacts/s  "
+              f"({added:,} added, {skipped:,} skipped)")
+
+    opened, db = timed(ContactDB, db_path)
+    print(f"  startup        {opened * 1000:>7.2f} ms")
+    print(f"  name lookup    {per_call_ms(db.get, names):>7.3f} ms")
+    print(f"  number check   {per_call_ms(db.has_number, numbers):>7.3f} ms")
+    print(f"  search         {per_call_ms(db.search, queries):>7.3f} ms   (fts: {db.fts})")
+    print(f"  A-Z first page {per_call_ms(lambda _: db.items().fetchmany(PAGE), range(QUERIES)):>7.3f} ms")
+    db.close()
+
+
+def main():
+    sizes = [int(s) for s in sys.argv[1:]] or SIZES
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in sizes:
+            run(n, workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+In-place trail decay and frame compositing for the particle overlay.
+
+The main loop used to build new full-resolution arrays every frame
+((overlay * 0.88).astype, (frame * 0.3).astype, cv2.add).  The Compositor
+owns its buffers and does the same maths through 256-entry LUTs with
+dst= arguments, so steady-state frames allocate no pixel buffers (only
+the small array objects OpenCV's bindings return).
+
+With track_allocations, begin_frame() / end_frame() bracket the whole
+render stage (particles, compositing, HUD) and frame_bytes is the peak
+traced allocation in between, so it includes the particle rasterizer and
+never reads 0.  tracemalloc sees NumPy and Python allocations, not
+OpenCV's internal ones.
+"""
+
+import tracemalloc
+
+import cv2
+import numpy as np
+
+
+def scale_lut(factor):
+    """LUT equal to (value * factor).astype(np.uint8) for every uint8 value."""
+    return (np.arange(256) * factor).astype(np.uint8)
+
+
+class Compositor:
+    def __init__(self, width, height, decay=0.88, dim=0.3, track_allocations=False):
+        self.width  = width
+        self.height = height
+        self._decay_lut = scale_lut(decay)
+        self._dim_lut   = scale_lut(dim)
+
+        self.overlay  = np.zeros((height, width, 3), dtype=np.uint8)
+        self.combined = np.zeros((height, width, 3), dtype=np.uint8)
+
+        # Peak bytes allocated during the last render frame
+        self.track_allocations = track_allocations
+        self.frame_bytes  = 0
+        self._frame_start = 0
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def begin_frame(self):
+        """Start counting the render stage's allocations (no-op unless tracking)."""
+        if self.track_allocations:
+            tracemalloc.reset_peak()
+            self._frame_start, _ = tracemalloc.get_traced_memory()
+
+    def end_frame(self):
+        if self.track_allocations:
+            _, peak = tracemalloc.get_traced_memory()
+            self.frame_bytes = max(0, peak - self._frame_start)
+
+    def decay(self):
+        """Fade the particle trails in place.  Call once at the start of a frame."""
+        cv2.LUT(self.overlay, self._decay_lut, dst=self.overlay)
+        return self.overlay
+
+    def compose(self, frame):
+        """Dim the camera frame and add the overlay on top, into self.combined."""
+        if frame.shape != self.combined.shape:
+            self.combined = np.empty_like(frame)
+        cv2.LUT(frame, self._dim_lut, dst=self.combined)
+        cv2.add(self.combined, self.overlay, dst=self.combined)
+        return self.combined
@@ -0,0 +1,55 @@
+"""
+Offline batch finger classification benchmark + regression check.
+
+Classifies a synthetic recorded landmark sequence (frames, hands, 21, 2)
+with the vectorized classifier, checks it against the original per-hand
+Python loop on a sample, and prints frames per second.
+
+Run: python day7-classify-benchmark.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common import finger_states
+
+FRAMES  = 1_000_000
+HANDS   = 2
+SAMPLE  = 5_000
+WIDTH, HEIGHT = 1280, 720
+
+
+def reference_fingers_up(hand_points, threshold=12):
+    """Original loop version of get_fingers_up"""
+    wrist_x   = hand_points[0][0]
+    thumb_up  = abs(hand_points[4][0] - wrist_x) > abs(hand_points[2][0] - wrist_x)
+    other = []
+    for tip_id, pip_id in [(8, 6), (12, 10), (16, 14), (20, 18)]:
+        other.append((hand_points[pip_id][1] - hand_points[tip_id][1]) > threshold)
+    return (thumb_up, other[0], other[1], other[2], other[3])
+
+
+def main():
+    rng = np.random.default_rng(0)
+    sequence = rng.integers(0, [WIDTH, HEIGHT], (FRAMES, HANDS, 21, 2), dtype=np.int16)
+
+    start = time.perf_counter()
+    codes = finger_states.pack(finger_states.fingers_up(sequence))
+    elapsed = time.perf_counter() - start
+    print(f"classified {FRAMES:,} frames x {HANDS} hands in {elapsed:.3f} s "
+          f"-> {FRAMES / elapsed / 1e6:.2f} M frames/s")
+
+    mismatches = 0
+    for f in rng.integers(0, FRAMES, SAMPLE):
+        for h in range(HANDS):
+            expected = finger_states.key_to_code(reference_fingers_up(sequence[f, h].tolist()))
+            mismatches += int(codes[f, h]) != expected
+    print(f"regression check on {SAMPLE} frames: {mismatches} mismatches")
+
+
+if __name__ == "__main__":
+    main()
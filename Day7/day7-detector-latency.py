@@ -0,0 +1,95 @@
+"""
+End-to-end latency comparison of the MediaPipe running modes.
+
+For IMAGE, VIDEO and LIVE_STREAM this runs the threaded pipeline for a few
+seconds each and measures camera timestamp -> rendered particle response,
+then prints one table.  Wave a hand in front of the camera while it runs.
+Inference time is the detector's own: the blocking call for IMAGE / VIDEO,
+submit -> result callback for LIVE_STREAM.
+
+Run: python day7-detector-latency.py
+"""
+
+import os
+import sys
+import time
+
+import cv2
+
+from compositor import Compositor
+from hand_detector import MODES, HandDetector
+from particle_engine import ParticleSystem
+from pipeline import HandPipeline
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.model_manager import ensure_model
+
+WIDTH, HEIGHT = 1280, 720
+MODEL_PATH    = "hand_landmarker.task"   # used if present, else the per-user model cache
+SECONDS       = 10
+NUM_PARTICLES = 800
+
+
+def run_mode(mode, model_path):
+    cap = cv2.VideoCapture(0)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH,  WIDTH)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, HEIGHT)
+
+    pipeline = HandPipeline(cap, None)
+    detector = HandDetector(model_path, WIDTH, HEIGHT, mode=mode, on_result=pipeline.publish)
+    pipeline.detect_fn = detector.detect
+    particles  = ParticleSystem(NUM_PARTICLES, WIDTH, HEIGHT)
+    compositor = Compositor(WIDTH, HEIGHT)
+    samples    = []
+
+    pipeline.start()
+    frame, hands = None, []
+    end_time = time.monotonic() + SECONDS
+    while pipeline.running and time.monotonic() < end_time:
+        item = pipeline.frames.get(timeout=1 / 30)
+        if item is not None:
+            if frame is not None:
+                pipeline.release(frame)
+            frame = item[1]
+        if frame is None:
+            continue
+        result = pipeline.results.get(timeout=0)
+        if result is not None:
+            hands_ts, hands = result
+
+        overlay = compositor.decay()
+        particles.update(hands, (True,) * 5, len(hands))
+        particles.draw(overlay)
+        cv2.imshow(f"Latency test: {mode}", compositor.compose(frame))
+        cv2.waitKey(1)
+
+        if result is not None:
+            now = time.monotonic()
+            samples.append((now - hands_ts) * 1000)
+
+    pipeline.stop()
+    detector.close()
+    cap.release()
+    cv2.destroyAllWindows()
+    if pipeline.error:
+        raise RuntimeError(f"{mode}: hand inference stopped") from pipeline.error
+
+    samples.sort()
+    p50 = samples[len(samples) // 2] if samples else 0.0
+    p95 = samples[int(len(samples) * 0.95)] if samples else 0.0
+    return len(samples), p50, p95, detector.stats.avg_ms, detector.stats.fps, detector.dropped
+
+
+def main():
+    model_path = ensure_model(local_path=MODEL_PATH)
+    rows = [(mode, *run_mode(mode, model_path)) for mode in MODES]
+    print(f"\n{'mode':<12} | {'results':>7} | {'p50 ms':>7} | {'p95 ms':>7} | {'infer ms':>8} "
+          f"| {'infer fps':>9} | {'dropped':>7}")
+    print("-" * 77)
+    for mode, count, p50, p95, infer_ms, fps, dropped in rows:
+        print(f"{mode:<12} | {count:>7} | {p50:>7.1f} | {p95:>7.1f} | {infer_ms:>8.1f} "
+              f"| {fps:>9.1f} | {dropped:>7}")
+
+
+if __name__ == "__main__":
+    main()
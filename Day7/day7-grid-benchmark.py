@@ -0,0 +1,72 @@
+"""
+Spatial grid benchmark: rebuild cost and fingertip queries vs brute force.
+
+The brute-force query measures the distance from a fingertip to every
+particle; the grid query only looks at the cells around it, so its cost
+follows the local particle count rather than the total.
+
+Run: python day7-grid-benchmark.py
+"""
+
+import time
+
+import numpy as np
+
+from particle_engine import ParticleSystem
+from spatial_grid import SpatialGrid
+
+WIDTH, HEIGHT = 1280, 720
+COUNTS        = [1_000, 10_000, 100_000, 1_000_000]
+RADIUS        = 20
+QUERIES       = 50
+FRAMES        = 20
+
+
+def timed(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def main():
+    rng = np.random.default_rng(0)
+    tips = rng.uniform((0, 0), (WIDTH, HEIGHT), (QUERIES, 2))
+
+    print(f"{'particles':>10} | {'full build ms':>13} | {'incr. build ms':>14} | "
+          f"{'brute query us':>14} | {'grid query us':>13}")
+    print("-" * 78)
+    for count in COUNTS:
+        system = ParticleSystem(count, WIDTH, HEIGHT, seed=0)
+        x, y = system.x, system.y
+
+        cold = SpatialGrid(WIDTH, HEIGHT)
+        build_ms = timed(lambda: (setattr(cold, "order", None), cold.build(x, y)), FRAMES)
+
+        # Incremental: rebuild after one frame of motion, as in the main loop
+        grid = SpatialGrid(WIDTH, HEIGHT)
+        grid.build(x, y)
+
+        def step():
+            system.update([], (False,) * 5, 0)
+            grid.build(system.x, system.y)
+        incr_ms = timed(step, FRAMES) - timed(lambda: system.update([], (False,) * 5, 0), FRAMES)
+
+        def brute():
+            for px, py in tips:
+                dx = system.x - px
+                dy = system.y - py
+                np.flatnonzero(dx * dx + dy * dy <= RADIUS * RADIUS)
+
+        def gridded():
+            for px, py in tips:
+                grid.query_radius(px, py, RADIUS, system.x, system.y)
+
+        brute_us = timed(brute, 3) / QUERIES * 1000
+        grid_us  = timed(gridded, 3) / QUERIES * 1000
+        print(f"{count:>10} | {build_ms:>13.2f} | {max(incr_ms, 0):>14.2f} | "
+              f"{brute_us:>14.1f} | {grid_us:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,21 +7,53 @@ Hand Gesture Particle System - ENHANCED VERSION
 """
 
 import cv2
-import random
-import math
 import os
+import sys
+import time
 import numpy as np
-from mediapipe.tasks import python as mp_python
-from mediapipe.tasks.python import vision
-import mediapipe as mp
+
+from particle_engine import ParticleSystem
+from particle_workers import ParallelParticleSystem
+from compositor import Compositor
+from pipeline import HandPipeline, StageStats
+from hand_detector import HandDetector
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.detection_scheduler import DetectionScheduler
+from common.landmark_filter import LandmarkFilter
+from common import finger_states
+from common.replay import Recorder
+from common.profiler import FrameProfiler
+from common.model_manager import MODEL_SHA256, MODEL_URL, BackgroundLoader, ensure_model
+from common.hud import TextCache
+from common.gesture_debounce import DOWN_PX, HOLD, UP_PX, GestureDebouncer
 
 # ─────────────────────────────────────────────
 #  SETTINGS
 # ─────────────────────────────────────────────
 WIDTH, HEIGHT  = 1280, 720
-NUM_PARTICLES  = 800          # more particles for tiny size
-MODEL_PATH     = "hand_landmarker.task"
-MODEL_URL      = "https://storage.googleapis.com/mediapipe-models/hand_landmarker/hand_landmarker/float16/1/hand_landmarker.task"
+NUM_PARTICLES  = 800          # vectorized engine — safe to raise a lot
+FLOCKING       = 0.0          # 0..1, particles align with their neighbours
+MAX_CELL_DENS  = 0            # density-limited respawn, particles per 32px cell (0 = off)
+FINGERTIP_HIT  = 0            # particles bounce off fingertips within this radius (0 = off)
+SIM_WORKERS    = 1            # >1 splits the particles over this many processes
+MAX_HANDS      = 2            # hands tracked; raise to 4+ for multi-user installations
+TWO_HAND_FX    = True         # exactly 2 hands -> midpoint effect instead of per-hand fields
+FINGER_UP_PX   = UP_PX        # finger counts as up once its tip is this far above the pip joint
+FINGER_DOWN_PX = DOWN_PX      # ... and as down again below this (hysteresis, was one 12 px line)
+GESTURE_HOLD   = HOLD         # seconds a new finger combination must persist to take effect
+MODEL_PATH     = "hand_landmarker.task"   # used if present, else the per-user model cache
+MODEL_TOFU     = False        # True = no pinned checksum, trust the first download (other model versions)
+LOADER_WAIT    = 2.0          # seconds to wait at exit for a model still loading before abandoning it
+TRACK_ALLOCS   = False        # show peak bytes allocated per frame by the whole render stage
+RENDER_FPS     = 30           # render rate when the camera / model fall behind
+SHOW_STATS     = False        # per-stage latency counters on the HUD
+DETECTOR_MODE  = "LIVE_STREAM"  # "IMAGE", "VIDEO" or "LIVE_STREAM" (async)
+METRICS_PATH   = None         # e.g. "day7_metrics.json": scheduler settings + achieved FPS, written at exit
+RECORD_PATH    = None         # path (no extension) to record frames + landmarks for replay
+PROFILE        = False        # per-stage timers + profile export at exit (near-zero cost when False)
+PROFILE_GRAPH  = False        # draw the p50/p95/p99 table + frame-time graph
+PROFILE_EXPORT = "day7_profile.json"   # .json or .csv, written at exit
 
 # ─────────────────────────────────────────────
 #  ALL GESTURE DEFINITIONS
@@ -70,181 +102,9 @@ GESTURE_MAP = {
     (True,  True,  True,  True,  True):  ("OPEN HAND",       (0,   255, 255), "Mega repel"),
 }
 
-# ─────────────────────────────────────────────
-#  PARTICLE CLASS
-# ─────────────────────────────────────────────
-class Particle:
-    def __init__(self):
-        self.reset()
-
-    def reset(self):
-        self.x    = random.uniform(0, WIDTH)
-        self.y    = random.uniform(0, HEIGHT)
-        self.vx   = random.uniform(-1.0, 1.0)
-        self.vy   = random.uniform(-1.0, 1.0)
-        self.life = random.uniform(0.5, 1.0)
-        self.size = 1                           # TINY particles — always 1px
-        # Random bright color
-        self.color = (
-            random.randint(100, 255),
-            random.randint(100, 255),
-            random.randint(100, 255),
-        )
-
-    def apply_force(self, tx, ty, strength, attract=True, swirl=0.0):
-        """Generic force: attract or repel from point (tx, ty)"""
-        dx = tx - self.x
-        dy = ty - self.y
-        dist = max(math.sqrt(dx**2 + dy**2), 1)
-        force = strength / (dist ** 1.3)
-        direction = 1 if attract else -1
-        self.vx += direction * (dx / dist) * force
-        self.vy += direction * (dy / dist) * force
-        # Swirl: add perpendicular component
-        if swirl != 0:
-            self.vx += (-dy / dist) * swirl
-            self.vy += ( dx / dist) * swirl
-
-    def update(self, all_hands_data, gesture_key, num_hands):
-        """
-        all_hands_data: list of hand_points for each detected hand
-        gesture_key: tuple of booleans e.g. (True,False,True,False,False)
-        num_hands: 1 or 2
-        """
-        if all_hands_data:
-            hand = all_hands_data[0]    # primary hand
-            px, py = hand[0]            # wrist/palm
-
-            t, i, m, r, p = gesture_key  # thumb, index, middle, ring, pinky
-
-            # ── 2 HANDS SPECIAL EFFECTS ──
-            if num_hands == 2 and len(all_hands_data) >= 2:
-                h1 = all_hands_data[0][0]
-                h2 = all_hands_data[1][0]
-                mid_x = (h1[0] + h2[0]) // 2
-                mid_y = (h1[1] + h2[1]) // 2
-                # Particles attracted to midpoint between two hands
-                self.apply_force(mid_x, mid_y, 40, attract=True, swirl=1.5)
-
-            # ── 0 FINGERS: FIST → spiral inward ──
-            elif not any([t, i, m, r, p]):
-                self.apply_force(px, py, 50, attract=True, swirl=1.2)
-
-            # ── 5 FINGERS: OPEN HAND → mega repel ──
-            elif all([t, i, m, r, p]):
-                self.apply_force(px, py, 120, attract=False)
-
-            # ── THUMB ONLY → float upward ──
-            elif t and not any([i, m, r, p]):
-                self.apply_force(px, py, 30, attract=True)
-                self.vy -= 0.8  # float up
-
-            # ── INDEX ONLY → stream to fingertip ──
-            elif i and not any([t, m, r, p]):
-                self.apply_force(hand[8][0], hand[8][1], 60, attract=True)
-
-            # ── MIDDLE ONLY → explode outward ──
-            elif m and not any([t, i, r, p]):
-                self.apply_force(px, py, 100, attract=False)
-                self.vx += random.uniform(-0.5, 0.5)
-                self.vy += random.uniform(-0.5, 0.5)
-
-            # ── RING ONLY → slow gentle spiral ──
-            elif r and not any([t, i, m, p]):
-                self.apply_force(px, py, 25, attract=True, swirl=0.5)
-
-            # ── PINKY ONLY → tiny scatter ──
-            elif p and not any([t, i, m, r]):
-                self.apply_force(px, py, 15, attract=False)
-                self.vx += random.uniform(-0.3, 0.3)
-                self.vy += random.uniform(-0.3, 0.3)
-
-            # ── PEACE (index+middle) → dual fingertip stream ──
-            elif i and m and not r and not p:
-                self.apply_force(hand[8][0], hand[8][1], 40, attract=True)
-                self.apply_force(hand[12][0], hand[12][1], 40, attract=True)
-
-            # ── HANG LOOSE (thumb+pinky) → wave effect ──
-            elif t and p and not any([i, m, r]):
-                self.apply_force(hand[4][0], hand[4][1], 30, attract=True)
-                self.apply_force(hand[20][0], hand[20][1], 30, attract=True)
-                self.vy -= 0.3
-
-            # ── THUMB+INDEX → pinch repel ──
-            elif t and i and not any([m, r, p]):
-                self.apply_force(hand[4][0], hand[4][1], 40, attract=False)
-                self.apply_force(hand[8][0], hand[8][1], 40, attract=False)
-
-            # ── INDEX+PINKY → wide repel (rock sign) ──
-            elif i and p and not any([t, m, r]):
-                self.apply_force(hand[8][0], hand[8][1], 35, attract=False)
-                self.apply_force(hand[20][0], hand[20][1], 35, attract=False)
-
-            # ── 3 fingers with index+middle+ring → fan out ──
-            elif i and m and r and not t and not p:
-                self.apply_force(hand[8][0],  hand[8][1],  30, attract=True)
-                self.apply_force(hand[12][0], hand[12][1], 30, attract=True)
-                self.apply_force(hand[16][0], hand[16][1], 30, attract=True)
-
-            # ── FOUR fingers (no pinky) → strong repel ──
-            elif t and i and m and r and not p:
-                self.apply_force(px, py, 90, attract=False)
-
-            # ── FOUR fingers (no thumb / four+pinky) → fountain ──
-            elif i and m and r and p and not t:
-                self.apply_force(px, py, 50, attract=True, swirl=0.8)
-                self.vy -= 0.6   # fountain upward
-
-            # ── DEFAULT for remaining combos → gentle orbit ──
-            else:
-                self.apply_force(px, py, 35, attract=True, swirl=0.6)
-
-        # Friction
-        self.vx *= 0.95
-        self.vy *= 0.95
-
-        # Speed cap
-        speed = math.sqrt(self.vx**2 + self.vy**2)
-        if speed > 15:
-            self.vx = (self.vx / speed) * 15
-            self.vy = (self.vy / speed) * 15
-
-        self.x += self.vx
-        self.y += self.vy
-
-        # Fade
-        self.life -= 0.004
-        if self.life <= 0 or not (0 <= self.x <= WIDTH) or not (0 <= self.y <= HEIGHT):
-            self.reset()
-
-    def draw(self, frame):
-        alpha = max(0.0, min(1.0, self.life))
-        b, g, r = self.color
-        cv2.circle(frame, (int(self.x), int(self.y)), 1,
-                   (int(b * alpha), int(g * alpha), int(r * alpha)), -1)
-
-# ─────────────────────────────────────────────
-#  FINGER STATE DETECTION
-# ─────────────────────────────────────────────
-def get_fingers_up(hand_points):
-    """Returns tuple of 5 booleans: (thumb, index, middle, ring, pinky)"""
-    if len(hand_points) < 21:
-        return (False, False, False, False, False)
-
-    THRESHOLD = 12
-
-    # Thumb (horizontal check)
-    wrist_x   = hand_points[0][0]
-    thumb_tip = hand_points[4][0]
-    thumb_mcp = hand_points[2][0]
-    thumb_up  = abs(thumb_tip - wrist_x) > abs(thumb_mcp - wrist_x)
-
-    # Other 4 fingers (vertical check)
-    other = []
-    for tip_id, pip_id in [(8, 6), (12, 10), (16, 14), (20, 18)]:
-        other.append((hand_points[pip_id][1] - hand_points[tip_id][1]) > THRESHOLD)
-
-    return (thumb_up, other[0], other[1], other[2], other[3])
+# Same entries indexed by packed finger code (bit 0 = thumb ... bit 4 = pinky)
+GESTURE_TABLE = finger_states.build_table(
+    lambda key: GESTURE_MAP.get(key, ("CUSTOM", (200, 200, 200), "Custom combo")))
 
 # ─────────────────────────────────────────────
 #  DRAW HAND SKELETON
@@ -263,55 +123,49 @@ def draw_hand(frame, hand_points, color=(150, 150, 150)):
     for pt in hand_points:
         cv2.circle(frame, pt, 2, (255, 255, 255), -1)
 
-# ─────────────────────────────────────────────
-#  DOWNLOAD MODEL
-# ─────────────────────────────────────────────
-def download_model():
-    if not os.path.exists(MODEL_PATH):
-        print("Downloading hand model... please wait")
-        import urllib.request
-        import ssl
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-        with urllib.request.urlopen(MODEL_URL, context=ctx) as r:
-            with open(MODEL_PATH, 'wb') as f:
-                f.write(r.read())
-        print("Model downloaded!")
-    else:
-        print("Model ready.")
+def close_detector(detector, loader):
+    """
+    Close detector, or the loader's once it finishes.  A download still
+    running after LOADER_WAIT is abandoned: the loader is a daemon thread,
+    so it does not keep the process alive.  Returns the detector or None.
+    """
+    if detector is None:
+        try:
+            detector = loader.get(timeout=LOADER_WAIT)
+        except TimeoutError:
+            print("Model still loading, not waiting for it")
+            return None
+    detector.close()
+    return detector
 
 # ─────────────────────────────────────────────
 #  MAIN
 # ─────────────────────────────────────────────
 def main():
-    download_model()
+    # Model download + landmarker creation run while the camera warms up
+    model_sha256 = None if MODEL_TOFU else MODEL_SHA256
+    detector_loader = BackgroundLoader(
+        lambda: HandDetector(ensure_model(MODEL_URL, model_sha256, MODEL_PATH, trust_on_first_use=MODEL_TOFU),
+                             WIDTH, HEIGHT,
+                             mode=DETECTOR_MODE, num_hands=MAX_HANDS,
+                             on_result=lambda ts, hands: pipeline.publish(ts, hands),
+                             on_timing=lambda ms: scheduler.record_inference(ms)))
+    detector = None   # set once the loader is done; frames render without it until then
 
     cap = cv2.VideoCapture(0)
     if not cap.isOpened():
         print("Camera not opened!")
         print("Fix: System Settings -> Privacy & Security -> Camera -> Turn ON Terminal")
+        close_detector(detector, detector_loader)
         return
 
     cap.set(cv2.CAP_PROP_FRAME_WIDTH,  WIDTH)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, HEIGHT)
 
-    # MediaPipe — detect up to 2 hands
-    base_options = mp_python.BaseOptions(model_asset_path=MODEL_PATH)
-    options = vision.HandLandmarkerOptions(
-        base_options=base_options,
-        num_hands=2,                         # detect BOTH hands
-        min_hand_detection_confidence=0.5,
-        min_hand_presence_confidence=0.5,
-        min_tracking_confidence=0.5,
-    )
-    detector = vision.HandLandmarker.create_from_options(options)
-
-    particles = [Particle() for _ in range(NUM_PARTICLES)]
-    overlay   = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    compositor = Compositor(WIDTH, HEIGHT, track_allocations=TRACK_ALLOCS)
 
     print("\n=== HAND GESTURE PARTICLE SYSTEM ===")
-    print(f"Tracking up to 2 hands | {NUM_PARTICLES} tiny particles")
+    print(f"Tracking up to {MAX_HANDS} hands | {NUM_PARTICLES} tiny particles | {SIM_WORKERS} sim worker(s)")
     print("All 32 finger combinations have unique effects!")
     print("Press Q to quit\n")
 
@@ -321,89 +175,197 @@ def main():
     current_color        = (180, 180, 180)
     current_fingers_key  = (False,) * 5
     num_hands_detected   = 0
-
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        frame     = cv2.flip(frame, 1)
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        mp_image  = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
-        result    = detector.detect(mp_image)
-
-        all_hands_data = []   # list of hand_points for each hand
-        all_keys       = []   # finger tuple for each hand
-
-        if result.hand_landmarks:
-            num_hands_detected = len(result.hand_landmarks)
-            for hand_lm in result.hand_landmarks:
-                hand_points = [
-                    (int(lm.x * WIDTH), int(lm.y * HEIGHT))
-                    for lm in hand_lm
-                ]
-                all_hands_data.append(hand_points)
-                all_keys.append(get_fingers_up(hand_points))
-
-                # Draw skeleton
-                draw_hand(frame, hand_points)
-
-            # Use first hand's gesture key for display
-            current_fingers_key = all_keys[0]
-            info = GESTURE_MAP.get(current_fingers_key,
-                                   ("CUSTOM", (200, 200, 200), "Custom combo"))
-            current_gesture_name = info[0]
-            current_color        = info[1]
-            current_gesture_desc = info[2]
-        else:
-            num_hands_detected  = 0
-            current_gesture_name = "NO HAND"
-            current_gesture_desc = "Show your hand to camera"
-            current_color        = (180, 180, 180)
-            current_fingers_key  = (False,) * 5
-
-        # ── Update particles ──
-        overlay = (overlay * 0.88).astype(np.uint8)
-        for p in particles:
-            p.update(all_hands_data, current_fingers_key, num_hands_detected)
-            p.draw(overlay)
-
-        # ── Combine frame + particles ──
-        dim_frame = (frame * 0.3).astype(np.uint8)
-        combined  = cv2.add(dim_frame, overlay)
-
-        # ── HUD — Finger indicators ──
-        finger_names = ["T", "I", "M", "R", "P"]
-        finger_x = 20
-        for idx, (fname, is_up) in enumerate(zip(finger_names, current_fingers_key)):
-            color = current_color if is_up else (60, 60, 60)
-            cv2.rectangle(combined, (finger_x, 10), (finger_x + 30, 50), color, -1)
-            cv2.putText(combined, fname, (finger_x + 7, 38),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 0), 2)
-            finger_x += 38
-
-        # ── Gesture name ──
-        cv2.putText(combined, current_gesture_name, (20, 80),
-                    cv2.FONT_HERSHEY_SIMPLEX, 1.0, current_color, 2)
-
-        # ── Description ──
-        cv2.putText(combined, current_gesture_desc, (20, 110),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
-
-        # ── Hand count ──
-        hand_msg = f"Hands detected: {num_hands_detected}"
-        if num_hands_detected == 2:
-            hand_msg += "  << TWO HANDS UP! Special effect! >>"
-        cv2.putText(combined, hand_msg, (20, HEIGHT - 20),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.6,
-                    (0, 255, 255) if num_hands_detected == 2 else (150, 150, 150), 1)
-
-        cv2.imshow("Hand Gesture Particles", combined)
-        if cv2.waitKey(1) & 0xFF == ord('q'):
-            break
-
-    cap.release()
-    cv2.destroyAllWindows()
+    all_keys             = []   # confirmed finger key per hand, for the particle fields
+
+    # Per-hand finger states with hysteresis + hold time; downstream state
+    # (HUD text, colour, force programs) only changes on confirmed transitions
+    gestures = GestureDebouncer(FINGER_UP_PX, FINGER_DOWN_PX, hold=GESTURE_HOLD)
+
+    pipeline = HandPipeline(cap, None)
+    # Smoothed landmarks, predicted forward by the measured camera -> render latency.
+    # Inference has its own thread, so it may be busy the whole time (max_duty=1)
+    scheduler = DetectionScheduler(target_fps=RENDER_FPS, max_duty=1.0, landmark_filter=LandmarkFilter())
+    profiler  = FrameProfiler(enabled=PROFILE, budget_ms=1000 / RENDER_FPS)
+
+    def detect(frame, ts):
+        # Every N-th frame only, on a downsampled copy
+        if detector is None or not scheduler.should_detect():
+            return None
+        with profiler.stage("detect"):
+            return detector.detect(scheduler.prepare(frame), ts)
+
+    pipeline.detect_fn = detect
+    render_stats   = StageStats("render")
+    e2e_stats      = StageStats("end-to-end")   # camera timestamp -> rendered response
+    frame          = None
+    work           = None
+    hands_ts       = 0.0
+    raw_hands      = []   # last unfiltered detection, for recording
+    recorder       = Recorder(RECORD_PATH) if RECORD_PATH else None
+    hud_text       = TextCache()   # rasterized once per distinct HUD string
+
+    effects = dict(flocking=FLOCKING, max_cell_density=MAX_CELL_DENS,
+                   fingertip_radius=FINGERTIP_HIT, two_hand_special=TWO_HAND_FX)
+    if SIM_WORKERS > 1:
+        particles = ParallelParticleSystem(NUM_PARTICLES, WIDTH, HEIGHT,
+                                           workers=SIM_WORKERS, max_hands=MAX_HANDS, **effects)
+    else:
+        particles = ParticleSystem(NUM_PARTICLES, WIDTH, HEIGHT)
+        for name, value in effects.items():
+            setattr(particles, name, value)
+
+    # Everything below owns threads, worker processes or shared memory:
+    # release them even when the loop raises
+    try:
+        pipeline.start()
+
+        while pipeline.running:
+            if detector is None and detector_loader.ready():
+                detector = detector_loader.get()
+                print("Hand detector ready.")
+
+            # Newest camera frame; keep animating on the last one if none arrived
+            item = pipeline.frames.get(timeout=1.0 / RENDER_FPS)
+            if item is not None:
+                if frame is not None:
+                    pipeline.release(frame)   # done with it: its buffer may be reused
+                frame = item[1]
+            if frame is None:
+                continue
+            start = time.monotonic()   # busy time only, not the wait above
+            compositor.begin_frame()
+
+            # Newest landmarks; keep the previous ones while inference is busy
+            with profiler.stage("landmarks"):
+                result = pipeline.results.get(timeout=0)
+                if result is not None:
+                    hands_ts, raw_hands = result
+                    scheduler.observe(*result)
+                new_result = result is not None
+
+                if recorder and item is not None:
+                    recorder.add(item[0], frame, raw_hands)
+
+                # list of hand_points for each hand, extrapolated between detections
+                all_hands_data = scheduler.predict(start)
+
+            if work is None or work.shape != frame.shape:
+                work = np.empty_like(frame)
+            np.copyto(work, frame)
+
+            with profiler.stage("classify"):
+                all_codes = gestures.update(start, all_hands_data)   # confirmed finger code per hand
+            for hand_points in all_hands_data:
+                draw_hand(work, hand_points)
+
+            if gestures.changed:
+                num_hands_detected = len(all_codes)
+                all_keys = [finger_states.code_to_key(code) for code in all_codes]
+
+                if num_hands_detected:
+                    # Use first hand's gesture key for display
+                    current_fingers_key = all_keys[0]
+                    info = GESTURE_TABLE[all_codes[0]]
+                    current_gesture_name = info[0]
+                    current_color        = info[1]
+                    current_gesture_desc = info[2]
+                else:
+                    current_gesture_name = "NO HAND"
+                    current_gesture_desc = "Show your hand to camera"
+                    current_color        = (180, 180, 180)
+                    current_fingers_key  = (False,) * 5
+
+            # ── Update particles ──
+            with profiler.stage("particles"):
+                overlay = compositor.decay()
+                particles.update(all_hands_data, current_fingers_key, num_hands_detected, all_keys)
+                particles.draw(overlay)
+
+            # ── Combine frame + particles ──
+            with profiler.stage("compose"):
+                combined = compositor.compose(work)
+
+            with profiler.stage("hud"):
+                # ── HUD — Finger indicators ──
+                finger_names = ["T", "I", "M", "R", "P"]
+                finger_x = 20
+                for idx, (fname, is_up) in enumerate(zip(finger_names, current_fingers_key)):
+                    color = current_color if is_up else (60, 60, 60)
+                    cv2.rectangle(combined, (finger_x, 10), (finger_x + 30, 50), color, -1)
+                    hud_text.put(combined, fname, (finger_x + 7, 38), 0.7, (0, 0, 0), 2)
+                    finger_x += 38
+
+                # ── Gesture name ──
+                hud_text.put(combined, current_gesture_name, (20, 80), 1.0, current_color, 2)
+
+                # ── Description ──
+                hud_text.put(combined, current_gesture_desc, (20, 110), 0.5, (200, 200, 200), 1)
+
+                # ── Hand count ──
+                hand_msg = f"Hands detected: {num_hands_detected}"
+                if num_hands_detected == 2 and TWO_HAND_FX:
+                    hand_msg += "  << TWO HANDS UP! Special effect! >>"
+                elif num_hands_detected >= 2:
+                    hand_msg += "  << every hand drives its own field >>"
+                hud_text.put(combined, hand_msg, (20, HEIGHT - 20), 0.6,
+                             (0, 255, 255) if num_hands_detected >= 2 else (150, 150, 150), 1)
+
+                if TRACK_ALLOCS:
+                    # particles + HUD included; decay/compose alone are covered by tests/test_compositor.py
+                    cv2.putText(combined, f"Render stage alloc: {compositor.frame_bytes} B/frame",
+                                (WIDTH - 360, HEIGHT - 20),
+                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (150, 150, 150), 1)
+
+                # Stats change every frame, caching them would only churn the cache
+                if SHOW_STATS:
+                    age_ms = (time.monotonic() - hands_ts) * 1000 if hands_ts else 0.0
+                    dropped = detector.dropped if detector else 0
+                    stale   = detector.stale if detector else 0
+                    stats_lines = [f"mode: {DETECTOR_MODE}  dropped: {dropped}  stale: {stale}",
+                                   scheduler.hud_text(),
+                                   str(pipeline.capture_stats),
+                                   str(detector.stats if detector else pipeline.inference_stats),
+                                   str(render_stats), str(e2e_stats),
+                                   f"landmark age: {age_ms:5.1f} ms",
+                                   gestures.hud_text()]
+                    for n, line in enumerate(stats_lines):
+                        cv2.putText(combined, line, (WIDTH - 300, 30 + n * 22),
+                                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (150, 150, 150), 1)
+
+                if PROFILE_GRAPH:
+                    profiler.draw(combined, WIDTH - 300, 200)
+
+            compositor.end_frame()
+            with profiler.stage("imshow"):
+                cv2.imshow("Hand Gesture Particles", combined)
+            now = time.monotonic()
+            render_stats.record(start, now)
+            scheduler.adapt(now)
+            if new_result:
+                e2e_stats.record(hands_ts, now)
+            profiler.end_frame()
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
+    finally:
+        pipeline.stop()
+        particles.close()
+        if recorder:
+            recorder.close()
+        cap.release()
+        cv2.destroyAllWindows()
+        detector = close_detector(detector, detector_loader)
+
+    dropped = detector.dropped if detector else 0
+    print(f"{DETECTOR_MODE}: end-to-end latency avg {e2e_stats.avg_ms:.1f} ms "
+          f"over {e2e_stats.count} results, {dropped} frames dropped")
+    if METRICS_PATH:
+        scheduler.dump_metrics(METRICS_PATH)
+        print(f"Scheduler metrics written to {METRICS_PATH}: {scheduler.metrics()}")
+    if PROFILE:
+        profiler.export(PROFILE_EXPORT)
+        print(f"Stage profile written to {PROFILE_EXPORT}")
+    if pipeline.error:
+        raise RuntimeError("Hand inference stopped") from pipeline.error
     print("Bye!")
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+"""
+Particle benchmarks:
+  - draw: per-particle cv2.circle vs batched rasterizer
+  - multi-hand update: cost of summing every hand's force field
+
+The rasterizer is about 4x faster than cv2.circle at 100k particles, but
+on one core that is still ~65 ms a frame: 100k particles do not fit a
+30 FPS budget (33 ms) together with the physics.  About 30k do.
+
+Run: python day7-particle-benchmark.py
+"""
+
+import time
+import numpy as np
+
+from particle_engine import ParticleSystem
+
+WIDTH, HEIGHT  = 1280, 720
+COUNTS         = [1_000, 10_000, 100_000]
+REPEATS        = 20
+HAND_COUNTS    = [1, 2, 4, 8]
+HAND_PARTICLES = 100_000
+
+
+def time_draw(draw, repeats=REPEATS):
+    overlay = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        overlay = (overlay * 0.88).astype(np.uint8)
+        draw(overlay)
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def time_hands(num_hands, repeats=REPEATS):
+    system = ParticleSystem(HAND_PARTICLES, WIDTH, HEIGHT, seed=0)
+    system.two_hand_special = False
+    rng = np.random.default_rng(1)
+    hands = [[tuple(pt) for pt in rng.integers(0, [WIDTH, HEIGHT], (21, 2)).tolist()]
+             for _ in range(num_hands)]
+    keys = [(True, False, False, False, True)] * num_hands   # HANG LOOSE: 2 terms per hand
+    start = time.perf_counter()
+    for _ in range(repeats):
+        system.update(hands, keys[0], num_hands, keys)
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def main():
+    print(f"{'particles':>10} | {'cv2.circle ms':>14} | {'rasterize ms':>13} | {'speedup':>7}")
+    print("-" * 54)
+    for count in COUNTS:
+        system = ParticleSystem(count, WIDTH, HEIGHT, seed=0)
+        old_ms = time_draw(system.draw_circles)
+        new_ms = time_draw(system.draw)
+        print(f"{count:>10} | {old_ms:>14.2f} | {new_ms:>13.2f} | {old_ms / new_ms:>6.1f}x")
+
+    print(f"\n{HAND_PARTICLES:,} particles, update with N hands:")
+    print(f"{'hands':>6} | {'ms/frame':>9}")
+    print("-" * 18)
+    for num_hands in HAND_COUNTS:
+        print(f"{num_hands:>6} | {time_hands(num_hands):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
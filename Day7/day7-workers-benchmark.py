@@ -0,0 +1,49 @@
+"""
+Multi-core particle simulation scaling benchmark.
+
+Times one update() of a large particle population with 1..N worker
+processes (shared-memory slices, barrier per frame) against the plain
+single-process ParticleSystem.
+
+Run: python day7-workers-benchmark.py
+"""
+
+import os
+import time
+
+from particle_engine import ParticleSystem
+from particle_workers import ParallelParticleSystem
+
+WIDTH, HEIGHT = 1280, 720
+COUNT         = 1_000_000
+FRAMES        = 30
+
+# A hand in the middle of the screen, open palm (mega repel)
+HAND = [(WIDTH // 2 + i, HEIGHT // 2 + i) for i in range(21)]
+KEY  = (True,) * 5
+
+
+def time_updates(system):
+    system.update([HAND], KEY, 1)   # warm-up
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        system.update([HAND], KEY, 1)
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    base_ms = time_updates(ParticleSystem(COUNT, WIDTH, HEIGHT, seed=0))
+    print(f"{COUNT:,} particles, single process: {base_ms:.2f} ms/frame\n")
+    print(f"{'workers':>7} | {'ms/frame':>9} | {'speedup':>7}")
+    print("-" * 30)
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        system = ParallelParticleSystem(COUNT, WIDTH, HEIGHT, workers=workers, seed=0)
+        try:
+            ms = time_updates(system)
+        finally:
+            system.close()
+        print(f"{workers:>7} | {ms:>9.2f} | {base_ms / ms:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
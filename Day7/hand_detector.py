@@ -0,0 +1,140 @@
+"""
+MediaPipe hand landmarker wrapper with selectable running mode.
+
+  IMAGE       -> blocking detector.detect() per frame (no tracking between frames)
+  VIDEO       -> blocking detector.detect_for_video(), reuses MediaPipe tracking
+  LIVE_STREAM -> detector.detect_async(); results arrive on a callback thread.
+                 Frames submitted while the model is still busy are dropped.
+                 If a callback never comes (MediaPipe skipped the frame), the
+                 busy flag is cleared after STALE_AFTER times the usual latency.
+
+HandDetector.stats times the model in every mode: the blocking call for
+IMAGE / VIDEO, submit -> callback for LIVE_STREAM.  on_timing(ms) is
+called with every such measurement (e.g. DetectionScheduler.record_inference).
+"""
+
+import threading
+import time
+
+import cv2
+import mediapipe as mp
+import numpy as np
+from mediapipe.tasks import python as mp_python
+from mediapipe.tasks.python import vision
+
+from pipeline import StageStats
+
+MODES = ("IMAGE", "VIDEO", "LIVE_STREAM")
+STALE_AFTER  = 4       # busy is given up after this many average latencies ...
+STALE_MIN_MS = 250     # ... but never sooner than this
+
+
+def to_hand_points(result, width, height):
+    """Returns list of hand_points (21 pixel tuples) for each detected hand"""
+    all_hands_data = []
+    for hand_lm in result.hand_landmarks or []:
+        all_hands_data.append([
+            (int(lm.x * width), int(lm.y * height))
+            for lm in hand_lm
+        ])
+    return all_hands_data
+
+
+class HandDetector:
+    """
+    detect(frame, ts) takes a BGR frame and its time.monotonic() timestamp.
+    IMAGE / VIDEO return the hand points directly.  LIVE_STREAM returns None
+    and calls on_result(ts, all_hands_data) from MediaPipe's thread instead.
+    """
+
+    def __init__(self, model_path, width, height, mode="IMAGE", num_hands=2, on_result=None,
+                 on_timing=None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown running mode: {mode}")
+        if mode == "LIVE_STREAM" and on_result is None:
+            raise ValueError("LIVE_STREAM mode needs an on_result callback")
+
+        self.mode      = mode
+        self.width     = width
+        self.height    = height
+        self.on_result = on_result
+        self.on_timing = on_timing
+
+        self.busy      = threading.Event()
+        self.last_ms   = -1
+        self.dropped   = 0
+        self.stale     = 0      # LIVE_STREAM frames whose callback never came
+        self.stats     = StageStats("detect")
+        self._pending  = {}     # LIVE_STREAM ts_ms -> submit time
+        self._busy_ms  = -1     # ts_ms of the frame busy is waiting for
+        self._rgb      = None   # reused BGR->RGB buffer (mp.Image copies it)
+
+        options = vision.HandLandmarkerOptions(
+            base_options=mp_python.BaseOptions(model_asset_path=model_path),
+            running_mode=getattr(vision.RunningMode, mode),
+            num_hands=num_hands,
+            min_hand_detection_confidence=0.5,
+            min_hand_presence_confidence=0.5,
+            min_tracking_confidence=0.5,
+            result_callback=self._on_async_result if mode == "LIVE_STREAM" else None,
+        )
+        self.detector = vision.HandLandmarker.create_from_options(options)
+
+    def _on_async_result(self, result, output_image, timestamp_ms):
+        submitted = self._pending.pop(timestamp_ms, None)
+        if submitted is not None:
+            self._timed(submitted)
+        if timestamp_ms >= self._busy_ms:   # a late result of a stale frame leaves busy alone
+            self.busy.clear()
+        self.on_result(timestamp_ms / 1000.0, to_hand_points(result, self.width, self.height))
+
+    def _timed(self, start):
+        self.stats.record(start, time.monotonic())
+        if self.on_timing:
+            self.on_timing(self.stats.last_ms)
+
+    def _busy(self):
+        """busy, unless the frame it waits for is overdue (its callback was skipped)"""
+        if not self.busy.is_set():
+            return False
+        submitted = self._pending.get(self._busy_ms)
+        limit_ms  = max(STALE_MIN_MS, STALE_AFTER * self.stats.avg_ms)
+        if submitted is not None and (time.monotonic() - submitted) * 1000 < limit_ms:
+            return True
+        self._pending.pop(self._busy_ms, None)
+        self.stale += 1
+        self.busy.clear()
+        return False
+
+    def detect(self, frame, ts):
+        # MediaPipe needs strictly increasing integer ms timestamps
+        ts_ms = int(ts * 1000)
+        if self.mode != "IMAGE" and ts_ms <= self.last_ms:
+            self.dropped += 1
+            return None
+        if self.mode == "LIVE_STREAM" and self._busy():
+            self.dropped += 1
+            return None
+
+        if self._rgb is None or self._rgb.shape != frame.shape:
+            self._rgb = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        mp_image  = mp.Image(image_format=mp.ImageFormat.SRGB, data=self._rgb)
+        self.last_ms = ts_ms
+
+        start = time.monotonic()
+        if self.mode == "LIVE_STREAM":
+            self._pending[ts_ms] = start
+            self._busy_ms = ts_ms
+            self.busy.set()
+            self.detector.detect_async(mp_image, ts_ms)
+            return None
+        if self.mode == "VIDEO":
+            result = self.detector.detect_for_video(mp_image, ts_ms)
+        else:
+            result = self.detector.detect(mp_image)
+        self._timed(start)
+        return to_hand_points(result, self.width, self.height)
+
+    def close(self):
+        self.detector.close()
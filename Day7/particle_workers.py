@@ -0,0 +1,193 @@
+"""
+Multi-core particle simulation over shared memory.
+
+The particle arrays live in multiprocessing.shared_memory blocks.  Each
+worker process owns a contiguous slice and runs a normal ParticleSystem
+over it.  Per frame the main process writes the hand landmarks and gesture
+code into a small control block, releases the workers through a barrier,
+waits on a second barrier, and then only rasterizes.
+
+Barrier waits on the main side time out after BARRIER_TIMEOUT and check
+that the workers are alive; a worker that raises aborts both barriers.
+Either way update() stops the workers and raises instead of hanging, and
+close() still releases the shared memory.
+"""
+
+import multiprocessing as mp
+import os
+import sys
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from particle_engine import FIELDS, ParticleSystem, rasterize
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.finger_states import code_to_key, key_to_code
+
+MAX_HANDS       = 8      # default hand capacity of the control block
+NUM_LANDMARKS   = 21
+BARRIER_TIMEOUT = 5.0    # seconds; a frame of physics takes milliseconds
+
+# Control block header slots, followed by one gesture code per hand (-1 = none)
+STOP, NUM_HANDS, GESTURE_CODE, HANDS_LEN = range(4)
+HEADER_SLOTS = 4
+
+
+def _attach(names, count, max_hands):
+    """Open the shared blocks and wrap them as numpy arrays."""
+    blocks, arrays = [], {}
+    for name, (dtype, shape) in FIELDS.items():
+        shm = shared_memory.SharedMemory(name=names[name])
+        blocks.append(shm)
+        arrays[name] = np.ndarray((count,) + shape, dtype=dtype, buffer=shm.buf)
+    header_shm = shared_memory.SharedMemory(name=names["header"])
+    hands_shm  = shared_memory.SharedMemory(name=names["hands"])
+    blocks += [header_shm, hands_shm]
+    header = np.ndarray(HEADER_SLOTS + max_hands, dtype=np.int64, buffer=header_shm.buf)
+    hands  = np.ndarray((max_hands, NUM_LANDMARKS, 2), dtype=np.int32, buffer=hands_shm.buf)
+    return blocks, arrays, header, hands
+
+
+def _worker(names, count, lo, hi, width, height, seed, effects, max_hands, start, done):
+    blocks, arrays, header, hands = _attach(names, count, max_hands)
+    system = None
+    try:
+        system = ParticleSystem(hi - lo, width, height, seed=seed,
+                                buffers={name: arr[lo:hi] for name, arr in arrays.items()})
+        for name, value in effects.items():
+            setattr(system, name, value)
+        done.wait()   # initial reset finished
+
+        while True:
+            start.wait()
+            if header[STOP]:
+                break
+            hands_len = int(header[HANDS_LEN])
+            all_hands_data = [[tuple(pt) for pt in hand] for hand in hands[:hands_len].tolist()]
+            codes = header[HEADER_SLOTS:HEADER_SLOTS + hands_len]
+            all_keys = [code_to_key(code) for code in codes] if (codes >= 0).all() else None
+            system.update(all_hands_data, code_to_key(header[GESTURE_CODE]),
+                          int(header[NUM_HANDS]), all_keys)
+            done.wait()
+    except threading.BrokenBarrierError:
+        pass   # the main process gave up (timeout or another worker failed)
+    except BaseException:
+        start.abort()   # wake the main process instead of letting it wait forever
+        done.abort()
+        raise
+    finally:
+        del arrays, header, hands, system   # views into the blocks must go before close()
+        for shm in blocks:
+            shm.close()
+
+
+class ParallelParticleSystem:
+    """Same update / draw interface as ParticleSystem, split over worker processes."""
+
+    def __init__(self, count, width, height, workers=None, seed=None, max_hands=MAX_HANDS, **effects):
+        self.count     = count
+        self.width     = width
+        self.height    = height
+        self.workers   = workers or os.cpu_count()
+        self.max_hands = max_hands
+        self.procs     = []
+        self._failed   = False
+        self._closed   = False
+
+        self._blocks = {}
+        for name, (dtype, shape) in FIELDS.items():
+            nbytes = max(1, count * int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize)
+            self._blocks[name] = shared_memory.SharedMemory(create=True, size=nbytes)
+        self._blocks["header"] = shared_memory.SharedMemory(create=True, size=(HEADER_SLOTS + max_hands) * 8)
+        self._blocks["hands"]  = shared_memory.SharedMemory(
+            create=True, size=max_hands * NUM_LANDMARKS * 2 * 4)
+        names = {name: shm.name for name, shm in self._blocks.items()}
+
+        arrays = {name: np.ndarray((count,) + shape, dtype=dtype, buffer=self._blocks[name].buf)
+                  for name, (dtype, shape) in FIELDS.items()}
+        self.x, self.y, self.life, self.palette = arrays["x"], arrays["y"], arrays["life"], arrays["palette"]
+        self.header = np.ndarray(HEADER_SLOTS + max_hands, dtype=np.int64, buffer=self._blocks["header"].buf)
+        self.hands  = np.ndarray((max_hands, NUM_LANDMARKS, 2), dtype=np.int32,
+                                 buffer=self._blocks["hands"].buf)
+        self.header[:] = 0
+
+        self.start = mp.Barrier(self.workers + 1)
+        self.done  = mp.Barrier(self.workers + 1)
+        bounds = np.linspace(0, count, self.workers + 1).astype(int)
+        try:
+            for i in range(self.workers):
+                worker_seed = None if seed is None else seed + i
+                proc = mp.Process(target=_worker, daemon=True,
+                                  args=(names, count, bounds[i], bounds[i + 1], width, height,
+                                        worker_seed, effects, max_hands, self.start, self.done))
+                proc.start()
+                self.procs.append(proc)
+            self._wait(self.done)
+        except BaseException:
+            self.close()
+            raise
+
+    def _wait(self, barrier):
+        """barrier.wait() that raises if a worker died, failed or hangs."""
+        try:
+            if all(proc.is_alive() for proc in self.procs):
+                barrier.wait(BARRIER_TIMEOUT)
+                return
+        except threading.BrokenBarrierError:
+            pass
+        # No abort() here: a multiprocessing barrier's notify waits for every
+        # sleeper to wake, and a killed worker never does.  Stop them instead.
+        self._failed = True
+        for proc in self.procs:
+            proc.join(timeout=0.5)   # a failing worker exits right after its abort()
+        dead = [proc.exitcode for proc in self.procs if proc.exitcode]
+        self._stop_workers(timeout=0)
+        if dead:
+            raise RuntimeError(f"Particle worker failed (exit codes {dead})")
+        raise RuntimeError(f"Particle workers did not finish within {BARRIER_TIMEOUT} s")
+
+    def _stop_workers(self, timeout=2.0):
+        for proc in self.procs:
+            proc.join(timeout)
+            if proc.is_alive():
+                proc.terminate()
+                proc.join()
+
+    def update(self, all_hands_data, gesture_key, num_hands, all_keys=None):
+        hands = all_hands_data
+        if len(hands) > self.max_hands:
+            raise ValueError(f"{len(hands)} hands, but the workers were set up for max_hands={self.max_hands}")
+        if hands:
+            self.hands[:len(hands)] = np.array(hands, dtype=np.int32)
+        codes = self.header[HEADER_SLOTS:HEADER_SLOTS + len(hands)]
+        if all_keys is None:
+            codes[:] = -1   # no per-hand keys
+        else:
+            codes[:] = [key_to_code(key) for key in all_keys[:len(hands)]]
+        self.header[HANDS_LEN]    = len(hands)
+        self.header[NUM_HANDS]    = num_hands
+        self.header[GESTURE_CODE] = key_to_code(gesture_key)
+        self._wait(self.start)   # workers run their slices
+        self._wait(self.done)    # all slices finished
+
+    def draw(self, frame, blend="max"):
+        rasterize(frame, self.x, self.y, self.palette, self.life, blend=blend)
+
+    def close(self):
+        """Stop the workers and free the shared memory; safe to call after a failure."""
+        if self._closed:
+            return
+        self._closed = True
+        if not self._failed:
+            self.header[STOP] = 1
+            try:
+                self._wait(self.start)
+            except RuntimeError:
+                pass   # already stopped by _wait()
+        self._stop_workers()
+        del self.x, self.y, self.life, self.palette, self.header, self.hands
+        for shm in self._blocks.values():
+            shm.close()
+            shm.unlink()
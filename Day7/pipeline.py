@@ -0,0 +1,230 @@
+"""
+Threaded capture / inference pipeline for the hand gesture particle system.
+
+  capture thread   -> cap.read() + flip into a pooled buffer (FramePool),
+                      posted into two latest-frame-wins mailboxes
+  inference thread -> takes the newest frame, runs the hand detector,
+                      publishes hand points into a second latest-wins mailbox
+  render loop      -> (main thread) animates particles against whatever
+                      frame and landmarks are newest, never waits on the model
+
+Slow inference only makes the landmarks older; it no longer blocks the
+render loop or lets the camera buffer fill up.  If detect_fn raises, the
+pipeline stops and the exception is kept in HandPipeline.error.
+
+Frame buffers are reference counted: each captured frame is owned by the
+render loop and the inference thread, a mailbox releases the frames it
+replaces, inference releases its frame once detect_fn returns, and the
+render loop calls HandPipeline.release(frame) when it moves on to the
+next one.  A buffer is only rewritten after both have released it; with
+none free the capture thread drops the camera frame.
+"""
+
+import threading
+import time
+
+import cv2
+import numpy as np
+
+# Frame buffers: one being written, one in each mailbox, one held by the
+# render loop and one by inference -> 5 never runs out unless a consumer
+# forgets to release.
+FRAME_POOL = 5
+
+
+# ─────────────────────────────────────────────
+#  LATEST-WINS MAILBOX
+# ─────────────────────────────────────────────
+class LatestQueue:
+    """
+    Single-slot mailbox: put() replaces an item nobody has taken yet and
+    passes the replaced one to on_drop (e.g. to release its frame buffer).
+    """
+
+    def __init__(self, on_drop=None):
+        self.item    = None
+        self.full    = False
+        self.cond    = threading.Condition()
+        self.dropped = 0
+        self.on_drop = on_drop
+
+    def put(self, item):
+        with self.cond:
+            if self.full:
+                self.dropped += 1
+                if self.on_drop:
+                    self.on_drop(self.item)
+            self.item = item
+            self.full = True
+            self.cond.notify()
+
+    def get(self, timeout=None):
+        """The newest item, or None on timeout."""
+        with self.cond:
+            if not self.full and not self.cond.wait_for(lambda: self.full, timeout):
+                return None
+            item, self.item, self.full = self.item, None, False
+            return item
+
+
+# ─────────────────────────────────────────────
+#  REFERENCE-COUNTED FRAME BUFFERS
+# ─────────────────────────────────────────────
+class FramePool:
+    """
+    Up to `size` reusable frame buffers.  acquire(like, owners) returns a
+    free buffer shaped like `like` that stays out of the pool until each
+    of the owners has called release(buf) on it, or None if all are taken.
+    """
+
+    def __init__(self, size):
+        self.size      = size
+        self.lock      = threading.Lock()
+        self.free      = []
+        self.owners    = {}   # id(buffer) -> [buffer, owners left]
+        self.allocated = 0
+        self.exhausted = 0    # acquire() calls that found no free buffer
+
+    def acquire(self, like, owners=1):
+        with self.lock:
+            buf = None
+            while self.free and buf is None:
+                buf = self.free.pop()
+                if buf.shape != like.shape or buf.dtype != like.dtype:
+                    buf = None   # camera changed format: let the old buffer go
+                    self.allocated -= 1
+            if buf is None:
+                if self.allocated >= self.size:
+                    self.exhausted += 1
+                    return None
+                buf = np.empty_like(like)
+                self.allocated += 1
+            self.owners[id(buf)] = [buf, owners]
+            return buf
+
+    def release(self, buf):
+        with self.lock:
+            entry = self.owners[id(buf)]
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self.owners[id(buf)]
+                self.free.append(buf)
+
+
+# ─────────────────────────────────────────────
+#  PER-STAGE LATENCY COUNTERS
+# ─────────────────────────────────────────────
+class StageStats:
+    def __init__(self, name, smoothing=0.1):
+        self.name      = name
+        self.smoothing = smoothing
+        self.count     = 0
+        self.last_ms   = 0.0
+        self.avg_ms    = 0.0
+        self._last_end = None
+        self.fps       = 0.0
+
+    def record(self, start, end):
+        ms = (end - start) * 1000
+        self.count  += 1
+        self.last_ms = ms
+        self.avg_ms  = ms if self.count == 1 else self.avg_ms + self.smoothing * (ms - self.avg_ms)
+        if self._last_end is not None and end > self._last_end:
+            inst = 1.0 / (end - self._last_end)
+            self.fps = inst if self.count == 2 else self.fps + self.smoothing * (inst - self.fps)
+        self._last_end = end
+
+    def __str__(self):
+        return f"{self.name}: {self.avg_ms:5.1f} ms  {self.fps:5.1f} fps"
+
+
+# ─────────────────────────────────────────────
+#  PIPELINE
+# ─────────────────────────────────────────────
+class HandPipeline:
+    """
+    cap:       an opened cv2.VideoCapture
+    detect_fn: callable(bgr_frame, timestamp) -> list of hand_points, or
+               None when the result will arrive later through publish()
+    Frames are pushed as (timestamp, frame) and results as
+    (timestamp, all_hands_data), timestamps from time.monotonic().
+    A frame taken from `frames` must be handed back with release(frame).
+    """
+
+    def __init__(self, cap, detect_fn):
+        self.cap       = cap
+        self.detect_fn = detect_fn
+
+        self.pool       = FramePool(FRAME_POOL)
+        self.frames     = LatestQueue(on_drop=self._release_item)   # for the render loop
+        self.infer_in   = LatestQueue(on_drop=self._release_item)   # for the inference thread
+        self.results    = LatestQueue()
+
+        self.capture_stats   = StageStats("capture")
+        self.inference_stats = StageStats("inference")
+
+        self.running = False
+        self.error   = None   # exception that stopped the inference thread
+        self.threads = []
+
+        self._raw = None   # cap.read() destination
+
+    def start(self):
+        self.running = True
+        self.threads = [
+            threading.Thread(target=self._capture_loop,   name="capture",   daemon=True),
+            threading.Thread(target=self._inference_loop, name="inference", daemon=True),
+        ]
+        for t in self.threads:
+            t.start()
+
+    def stop(self):
+        self.running = False
+        for t in self.threads:
+            t.join(timeout=1.0)
+
+    def publish(self, ts, hands):
+        self.results.put((ts, hands))
+
+    def release(self, frame):
+        """Return a frame taken from `frames` to the pool."""
+        self.pool.release(frame)
+
+    def _release_item(self, item):
+        self.pool.release(item[1])
+
+    def _capture_loop(self):
+        while self.running:
+            start = time.monotonic()
+            ret, self._raw = self.cap.read(self._raw)
+            if not ret:
+                self.running = False
+                break
+            frame = self.pool.acquire(self._raw, owners=2)   # render loop + inference
+            if frame is None:
+                continue   # consumers still hold every buffer: drop this camera frame
+            cv2.flip(self._raw, 1, dst=frame)
+            now = time.monotonic()
+            self.capture_stats.record(start, now)
+            self.frames.put((now, frame))
+            self.infer_in.put((now, frame))
+
+    def _inference_loop(self):
+        while self.running:
+            item = self.infer_in.get(timeout=0.1)
+            if item is None:
+                continue
+            ts, frame = item
+            start = time.monotonic()
+            try:
+                hands = self.detect_fn(frame, ts)
+            except Exception as e:
+                # Stop rather than keep rendering on landmarks that will never update
+                self.error   = e
+                self.running = False
+                break
+            finally:
+                self.pool.release(frame)   # detect_fn copies what it keeps
+            self.inference_stats.record(start, time.monotonic())
+            if hands is not None:
+                self.publish(ts, hands)
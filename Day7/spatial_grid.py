@@ -0,0 +1,83 @@
+"""
+Uniform spatial hash grid over the particle canvas.
+
+Particles are binned into square cells and sorted by cell id, so every
+cell's particles are one contiguous slice of `order`.  Neighbourhood
+queries then only touch the few cells around a point instead of every
+particle.
+"""
+
+import math
+
+import numpy as np
+
+
+class SpatialGrid:
+    def __init__(self, width, height, cell_size=32):
+        self.cell_size = cell_size
+        self.cols      = int(math.ceil(width / cell_size))
+        self.rows      = int(math.ceil(height / cell_size))
+        self.num_cells = self.cols * self.rows
+
+        self.cell   = None   # cell id of every particle
+        self.order  = None   # particle indices sorted by cell id
+        self.counts = np.zeros(self.num_cells, dtype=np.int64)
+        self.starts = np.zeros(self.num_cells, dtype=np.int64)
+
+    def cell_of(self, x, y):
+        cx = np.clip((x // self.cell_size).astype(np.int32), 0, self.cols - 1)
+        cy = np.clip((y // self.cell_size).astype(np.int32), 0, self.rows - 1)
+        return cy * self.cols + cx
+
+    def build(self, x, y):
+        """Re-bin all particles.  Call once per frame after they moved."""
+        cell = self.cell_of(x, y)
+        if self.order is not None and len(self.order) == len(cell):
+            # Particles move a few pixels per frame, so last frame's order is
+            # almost sorted already and the stable (tim)sort is close to linear
+            order = self.order[np.argsort(cell[self.order], kind="stable")]
+        else:
+            order = np.argsort(cell, kind="stable")
+
+        self.cell   = cell
+        self.order  = order
+        self.counts = np.bincount(cell, minlength=self.num_cells)
+        self.starts[0] = 0
+        np.cumsum(self.counts[:-1], out=self.starts[1:])
+
+    # ─────────────────────────────────────────
+    #  QUERIES
+    # ─────────────────────────────────────────
+    def candidates(self, px, py, radius):
+        """Indices of particles in the cells overlapping the circle's bounding box."""
+        cs = self.cell_size
+        c0 = max(0, int((px - radius) // cs))
+        c1 = min(self.cols - 1, int((px + radius) // cs))
+        r0 = max(0, int((py - radius) // cs))
+        r1 = min(self.rows - 1, int((py + radius) // cs))
+        if c0 > c1 or r0 > r1:
+            return np.zeros(0, dtype=np.int64)
+
+        # Cells c0..c1 of one row are consecutive ids -> one slice per row
+        slices = []
+        for row in range(r0, r1 + 1):
+            first = row * self.cols + c0
+            last  = row * self.cols + c1
+            slices.append(self.order[self.starts[first]:self.starts[last] + self.counts[last]])
+        return np.concatenate(slices)
+
+    def query_radius(self, px, py, radius, x, y):
+        """Indices of particles within radius of (px, py)."""
+        idx = self.candidates(px, py, radius)
+        dx = x[idx] - px
+        dy = y[idx] - py
+        return idx[dx * dx + dy * dy <= radius * radius]
+
+    def cell_mean(self, values):
+        """Per-particle mean of `values` over the particle's own cell."""
+        sums = np.bincount(self.cell, weights=values, minlength=self.num_cells)
+        return (sums / np.maximum(self.counts, 1))[self.cell]
+
+    def density(self):
+        """Particle count per cell as a (rows, cols) array."""
+        return self.counts.reshape(self.rows, self.cols)
@@ -0,0 +1,279 @@
+"""
+Catching game engine shared by both Day8 games.
+
+The game itself (falling objects, player, fixed-timestep clock, gesture
+time scales) does not know where hands come from.  Anything with a
+read() -> (timestamp, frame, hand) method can drive it: the camera +
+MediaPipe (hand_tracker.LiveInput), a recording or a scripted synthetic
+hand (hand_inputs), so the same game runs live or headless.
+"""
+
+import os
+import sys
+from collections import namedtuple
+
+import cv2
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common import finger_states
+from common.hud import TextCache
+
+# -------------------------
+# Config
+# -------------------------
+SCREEN_WIDTH = 640
+SCREEN_HEIGHT = 480
+TARGET_FPS = 30
+NUM_OBJECTS = None  # None = 2 or 3 falling objects; e.g. 300 for hard mode
+SIM_HZ = 30  # fixed game-physics rate; object speeds are pixels per step
+MAX_STEPS = 5  # most physics steps per rendered frame (drops time after a long stall)
+
+# Game-time scale per gesture (game state itself is never changed by gestures)
+TIME_SCALES = {
+    "FIST": 0.0,         # pause
+    "TWO_FINGERS": 0.4,  # slow motion
+}
+
+# Smoothed landmark in pixel coordinates (same .x / .y access as MediaPipe landmarks)
+Point = namedtuple("Point", ["x", "y"])
+
+# HUD text sprites, shared by every Game (score / lives values repeat a lot)
+HUD_TEXT = TextCache()
+
+
+# -------------------------
+# Game objects
+# -------------------------
+class Player:
+    def __init__(self, x, y, radius=20):
+        self.x = x
+        self.y = y
+        self.radius = radius
+
+    def update_from_hand(self, x, y):
+        self.x = x
+        self.y = y
+
+    def draw(self, frame):
+        cv2.circle(frame, (int(self.x), int(self.y)), self.radius, (255, 0, 0), -1)
+
+
+class FallingObjects:
+    """
+    All falling objects as component arrays (x, y, speed, radius), so
+    moving, catching and respawning hundreds of them is a few NumPy ops
+    instead of a method call per object.
+    """
+    def __init__(self, count, radius=15, rng=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.x = np.zeros(count, dtype=np.float32)
+        self.y = np.zeros(count, dtype=np.float32)
+        self.prev_y = np.zeros(count, dtype=np.float32)  # y before the last step, for interpolation
+        self.speed = np.zeros(count, dtype=np.float32)
+        self.radius = np.full(count, radius, dtype=np.float32)
+        self.respawn(np.arange(count))
+
+    def __len__(self):
+        return len(self.x)
+
+    def respawn(self, idx):
+        """Move the objects at idx back above the screen with a new speed."""
+        n = len(idx)
+        self.x[idx] = self.rng.integers(0, SCREEN_WIDTH + 1, n)
+        self.y[idx] = self.rng.integers(-300, -49, n)
+        self.prev_y[idx] = self.y[idx]
+        self.speed[idx] = self.rng.integers(2, 5, n)  # not greater than 4
+
+    def update(self):
+        self.prev_y[:] = self.y
+        self.y += self.speed
+
+    def hits(self, x, y, radius):
+        """Mask of objects touching a circle (squared distances, no sqrt)"""
+        dx = self.x - x
+        dy = self.y - y
+        reach = self.radius + radius
+        return dx * dx + dy * dy < reach * reach
+
+    def draw(self, frame, alpha=1.0):
+        """alpha: 0..1 between the previous and the current step"""
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        # Only objects that are (partly) on screen
+        visible = np.flatnonzero(y > -self.radius)
+        xs = self.x[visible].astype(np.int32).tolist()
+        ys = y[visible].astype(np.int32).tolist()
+        rs = self.radius[visible].astype(np.int32).tolist()
+        for x, y, r in zip(xs, ys, rs):
+            cv2.circle(frame, (x, y), r, (0, 255, 255), -1)
+
+
+class GestureDetector:
+    """
+    Classifies simple gestures from 21 hand landmarks:
+    FIST, OPEN, TWO_FINGERS, UNKNOWN
+    Landmark indices (MediaPipe):
+      0 = wrist
+      4 = thumb tip
+      8 = index tip
+      12 = middle tip
+      16 = ring tip
+      20 = pinky tip
+      5, 9, 13, 17 = finger base joints (MCP)
+    """
+    @staticmethod
+    def label_for(fingers):
+        """fingers = (thumb, index, middle, ring, pinky) extended flags"""
+        thumb_ext, index_ext, middle_ext, ring_ext, pinky_ext = fingers
+        extended_count = sum(fingers)
+
+        # FIST: none or only one extended
+        if extended_count <= 1:
+            return "FIST"
+
+        # TWO FINGERS: index + middle extended, ring & pinky folded
+        if index_ext and middle_ext and not ring_ext and not pinky_ext:
+            return "TWO_FINGERS"
+
+        # OPEN: most fingers extended
+        if extended_count >= 4:
+            return "OPEN"
+
+        return "UNKNOWN"
+
+    def __init__(self):
+        # One label per packed finger code, so classifying is an array lookup
+        self.labels = np.array(finger_states.build_table(self.label_for))
+
+    def classify(self, hand_landmarks):
+        """hand_landmarks: 21 (x, y) pairs, e.g. Points"""
+        # tip.y < base.y means finger is extended (higher on screen)
+        points = np.asarray(hand_landmarks, dtype=np.float32)
+        return str(self.labels[finger_states.pack(finger_states.fingers_extended(points))])
+
+    def classify_batch(self, points):
+        """points: array (..., 21, 2+) -> array of labels (...), e.g. a recorded sequence"""
+        return self.labels[finger_states.pack(finger_states.fingers_extended(points))]
+
+
+class GameClock:
+    """
+    Fixed-timestep clock.  Real (scaled) time goes into an accumulator that
+    is spent in whole steps of dt; what is left over, as a fraction of a
+    step, is the interpolation alpha for drawing.
+    """
+    def __init__(self, step_hz=SIM_HZ, max_steps=MAX_STEPS):
+        self.dt = 1.0 / step_hz
+        self.max_steps = max_steps
+        self.time_scale = 1.0
+        self.accumulator = 0.0
+        self.steps = 0  # total steps taken
+
+    def advance(self, elapsed):
+        """Add elapsed real seconds; returns how many steps to simulate now."""
+        self.accumulator += elapsed * self.time_scale
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            # Too far behind (e.g. the camera stalled): drop the backlog
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.dt
+        self.steps += steps
+        return steps
+
+    @property
+    def alpha(self):
+        return min(self.accumulator / self.dt, 1.0)
+
+
+class Game:
+    def __init__(self, num_objects=NUM_OBJECTS, seed=None):
+        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, radius=20)
+        rng = np.random.default_rng(seed)
+        if num_objects is None:
+            num_objects = int(rng.choice([2, 3]))
+        self.objects = FallingObjects(num_objects, rng=rng)
+        self.score = 0
+        self.lives = 3
+        self.game_over = False
+        self.clock = GameClock()
+
+    def update(self):
+        """One fixed physics step"""
+        if self.game_over:
+            return
+
+        self.objects.update()
+
+        caught = self.objects.hits(self.player.x, self.player.y, self.player.radius)
+        missed = ~caught & (self.objects.y > SCREEN_HEIGHT)
+        self.score += int(np.count_nonzero(caught))
+        self.lives -= int(np.count_nonzero(missed))
+        self.objects.respawn(np.flatnonzero(caught | missed))
+
+        if self.lives <= 0:
+            self.game_over = True
+
+    def step(self, gesture, elapsed=1.0 / TARGET_FPS):
+        """
+        Advance the game by elapsed real seconds.  The gesture only sets the
+        time scale (FIST pauses, TWO_FINGERS is slow motion), so the
+        physics are the same however fast frames are rendered.
+        """
+        self.clock.time_scale = TIME_SCALES.get(gesture, 1.0)
+        for _ in range(self.clock.advance(elapsed)):
+            self.update()
+
+    def play(self, hand, elapsed, gestures=None):
+        """
+        One input frame: the player follows the index finger tip of hand
+        (21 points, or None), the classified gesture sets the time scale.
+        Returns the gesture label.
+        """
+        gesture = "UNKNOWN"
+        if hand is not None:
+            self.player.update_from_hand(*hand[8])
+            if gestures is not None:
+                gesture = gestures.classify(hand)
+        self.step(gesture, elapsed)
+        return gesture
+
+    def draw(self, frame, gesture_label=None):
+        """gesture_label None hides the gesture line (plain catching game)"""
+        # Draw objects, interpolated between the last two physics steps
+        self.objects.draw(frame, self.clock.alpha)
+
+        # Draw player
+        self.player.draw(frame)
+
+        # UI
+        HUD_TEXT.put(frame, f"Score: {self.score}", (10, 30), 1, (0, 255, 0), 2)
+        HUD_TEXT.put(frame, f"Lives: {self.lives}", (10, 70), 1, (0, 0, 255), 2)
+        if gesture_label is not None:
+            HUD_TEXT.put(frame, f"Gesture: {gesture_label}", (10, 110), 0.8, (255, 255, 255), 2)
+
+        if self.game_over:
+            HUD_TEXT.put(frame, "GAME OVER", (180, 240), 1.5, (0, 0, 255), 3)
+
+
+def play(game, source, gestures=None, max_frames=None, frame_hook=None):
+    """
+    Headless driver: feeds source into game until the game is over, the
+    source runs out or max_frames.  frame_hook(frame, gesture) runs after
+    each frame that has a frame (e.g. drawing).  Returns frames played.
+    """
+    frames = 0
+    last_ts = None
+    while not game.game_over and (max_frames is None or frames < max_frames):
+        item = source.read()
+        if item is None:
+            break
+        ts, frame, hand = item
+        elapsed = 1.0 / TARGET_FPS if last_ts is None else ts - last_ts
+        last_ts = ts
+        gesture = game.play(hand, elapsed, gestures)
+        if frame_hook is not None and frame is not None:
+            frame_hook(frame, gesture)
+        frames += 1
+    return frames
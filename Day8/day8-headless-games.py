@@ -0,0 +1,65 @@
+"""
+Many headless catching games in parallel, for load and balance testing.
+
+Each game is driven by a scripted synthetic hand (or a recording) with no
+camera, model or window, and runs until game over or --max-frames.
+Games are spread over a process pool; prints games per second and the
+score / survival spread.
+
+Run: python day8-headless-games.py --games 1000 [--objects 300] [--recording path]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from catch_engine import SCREEN_HEIGHT, SCREEN_WIDTH, TARGET_FPS, Game, GestureDetector, play
+from hand_inputs import RecordedInput, ScriptedInput
+
+
+def play_one(seed, num_objects, max_frames, recording, render):
+    """One game -> (score, frames played, physics steps, game over)"""
+    if recording:
+        source = RecordedInput(recording, loop=True, render=render)
+    else:
+        source = ScriptedInput(seed=seed, render=render)
+    game = Game(num_objects=num_objects, seed=seed)
+    hook = game.draw if render else None
+    frames = play(game, source, GestureDetector(), max_frames=max_frames, frame_hook=hook)
+    source.close()
+    return game.score, frames, game.clock.steps, game.game_over
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--objects", type=int, default=None, help="falling objects per game (default 2 or 3)")
+    parser.add_argument("--max-frames", type=int, default=TARGET_FPS * 600, help="frames before a game is cut off")
+    parser.add_argument("--recording", default=None, help="replay this recording's landmarks instead of a scripted hand")
+    parser.add_argument("--render", action="store_true", help=f"also draw every frame ({SCREEN_WIDTH}x{SCREEN_HEIGHT})")
+    args = parser.parse_args()
+
+    seeds = range(args.games)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(play_one, seeds,
+                                [args.objects] * args.games, [args.max_frames] * args.games,
+                                [args.recording] * args.games, [args.render] * args.games,
+                                chunksize=max(1, args.games // (args.workers * 4))))
+    seconds = time.perf_counter() - start
+
+    scores, frames, steps, finished = (np.array(column) for column in zip(*results))
+    print(f"{args.games} games on {args.workers} workers in {seconds:.2f} s")
+    print(f"  {args.games / seconds:10.1f} games/s")
+    print(f"  {frames.sum() / seconds:10.0f} frames/s   ({steps.sum() / seconds:.0f} physics steps/s)")
+    print(f"  score     mean {scores.mean():7.1f}   p50 {np.median(scores):6.0f}   max {scores.max():6d}")
+    print(f"  survived  mean {frames.mean() / TARGET_FPS:7.1f} s   "
+          f"game over in {finished.mean() * 100:.0f}% of games")
+
+
+if __name__ == "__main__":
+    main()
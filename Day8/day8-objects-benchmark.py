@@ -0,0 +1,111 @@
+"""
+Catching game frame time vs number of falling objects.
+
+  loop   -> one Python object per falling object, math.sqrt collision
+            (the game before FallingObjects)
+  arrays -> Game with FallingObjects component arrays
+
+Times update() and draw() on a blank frame while the player wanders
+around, so catches, misses and respawns all happen.
+
+Only update() is vectorized.  FallingObjects.draw() still calls
+cv2.circle once per object (OpenCV has no batched circle fill); it is
+only cheaper than the loop draw because it skips the objects still above
+the screen.
+
+Run: python day8-objects-benchmark.py
+"""
+
+import math
+import random
+import time
+
+import cv2
+import numpy as np
+
+from catch_engine import SCREEN_HEIGHT, SCREEN_WIDTH, Game, Player
+
+COUNTS  = [3, 30, 300, 3_000]
+FRAMES  = 300
+
+
+class LoopObject:
+    def __init__(self, width):
+        self.width = width
+        self.radius = 15
+        self.respawn()
+
+    def respawn(self):
+        self.x = random.randint(0, self.width)
+        self.y = random.randint(-300, -50)
+        self.speed = random.randint(2, 4)
+
+
+def loop_update(player, objects):
+    for obj in objects:
+        obj.y += obj.speed
+        dx = player.x - obj.x
+        dy = player.y - obj.y
+        if math.sqrt(dx*dx + dy*dy) < player.radius + obj.radius:
+            obj.respawn()
+        elif obj.y > SCREEN_HEIGHT:
+            obj.respawn()
+
+
+def loop_draw(frame, objects):
+    for obj in objects:
+        cv2.circle(frame, (int(obj.x), int(obj.y)), obj.radius, (0, 255, 255), -1)
+
+
+def player_path(frame_index):
+    return (SCREEN_WIDTH / 2 + SCREEN_WIDTH / 3 * math.sin(frame_index / 20),
+            SCREEN_HEIGHT / 2 + SCREEN_HEIGHT / 4 * math.cos(frame_index / 15))
+
+
+def time_loop(count):
+    random.seed(0)
+    player  = Player(0, 0)
+    objects = [LoopObject(SCREEN_WIDTH) for _ in range(count)]
+    frame   = np.zeros((SCREEN_HEIGHT, SCREEN_WIDTH, 3), dtype=np.uint8)
+    update_s = draw_s = 0.0
+    for i in range(FRAMES):
+        player.update_from_hand(*player_path(i))
+        start = time.perf_counter()
+        loop_update(player, objects)
+        mid = time.perf_counter()
+        loop_draw(frame, objects)
+        update_s += mid - start
+        draw_s   += time.perf_counter() - mid
+    return update_s / FRAMES * 1000, draw_s / FRAMES * 1000
+
+
+def time_arrays(count):
+    game  = Game(num_objects=count, seed=0)
+    frame = np.zeros((SCREEN_HEIGHT, SCREEN_WIDTH, 3), dtype=np.uint8)
+    update_s = draw_s = 0.0
+    for i in range(FRAMES):
+        game.lives = 3   # never game over: update() stops once it latches
+        game.game_over = False
+        game.player.update_from_hand(*player_path(i))
+        start = time.perf_counter()
+        game.update()
+        mid = time.perf_counter()
+        game.objects.draw(frame)
+        update_s += mid - start
+        draw_s   += time.perf_counter() - mid
+    return update_s / FRAMES * 1000, draw_s / FRAMES * 1000
+
+
+def main():
+    print(f"{'objects':>8} | {'loop update':>11} | {'array update':>12} | {'loop draw':>9} | {'array draw':>10}")
+    print("-" * 63)
+    for count in COUNTS:
+        loop_update_ms, loop_draw_ms = time_loop(count)
+        array_update_ms, array_draw_ms = time_arrays(count)
+        print(f"{count:>8} | {loop_update_ms:>11.3f} | {array_update_ms:>12.3f} "
+              f"| {loop_draw_ms:>9.3f} | {array_draw_ms:>10.3f}")
+    print("\n(ms per frame)")
+
+
+if __name__ == "__main__":
+    main()
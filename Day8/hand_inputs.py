@@ -0,0 +1,135 @@
+"""
+Camera-free hand inputs for the catching game (see catch_engine).
+
+  RecordedInput -> plays back the landmarks (and optionally frames) of a
+                   common.replay recording
+  ScriptedInput -> synthetic hand moving along a seeded path and switching
+                   between OPEN / TWO_FINGERS / FIST
+
+Both have the read() -> (timestamp, frame, hand) interface of LiveInput
+and need no camera, model or window, so many games can run in parallel.
+"""
+
+import os
+import sys
+
+import cv2
+import numpy as np
+
+from catch_engine import SCREEN_HEIGHT, SCREEN_WIDTH, TARGET_FPS
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.frame_prep import reuse
+from common.replay import Recording
+
+# Synthetic hand: first joint of thumb..pinky relative to the palm centre,
+# and the per-joint y step of an extended / folded finger
+FINGER_BASES = [(-40, 20), (-30, -20), (-10, -25), (10, -22), (28, -15)]
+EXTENDED_STEP = -22
+FOLDED_STEP = 8
+WRIST_OFFSET = 70
+
+# Finger states of the scripted gestures, and how often each is picked
+SCRIPTED_GESTURES = {
+    "OPEN": (True, True, True, True, True),
+    "TWO_FINGERS": (False, True, True, False, False),
+    "FIST": (False, False, False, False, False),
+}
+GESTURE_WEIGHTS = (0.7, 0.2, 0.1)
+
+
+def synthetic_hand(cx, cy, fingers):
+    """21 landmarks of a hand with its palm at (cx, cy); fingers = 5 extended flags"""
+    points = [(cx, cy + WRIST_OFFSET)]
+    for (bx, by), extended in zip(FINGER_BASES, fingers):
+        step = EXTENDED_STEP if extended else FOLDED_STEP
+        points += [(cx + bx, cy + by + step * joint) for joint in range(4)]
+    return points
+
+
+class RecordedInput:
+    """
+    Landmarks of a recording, first hand only.  Timestamps are the
+    recorded ones, so the game clock replays the original timing.
+    render=True also returns the recorded frames (blank ones if the
+    recording has no .frames file).
+    """
+    def __init__(self, recording, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, loop=False, render=False):
+        self.recording = recording if isinstance(recording, Recording) else Recording(recording)
+        self.width = width
+        self.height = height
+        self.loop = loop
+        self.render = render
+        self.index = -1
+        self._offset = 0.0  # added to timestamps after every wrap-around
+        self._frame = None
+
+    def read(self):
+        next_index = self.index + 1
+        if next_index >= len(self.recording):
+            if not self.loop or len(self.recording) == 0:
+                return None
+            ts = self.recording.timestamps
+            self._offset += ts[-1] - ts[0] + 1.0 / TARGET_FPS
+            next_index = 0
+        self.index = next_index
+
+        hands = self.recording.hands(self.index, self.width, self.height)
+        ts = float(self.recording.timestamps[self.index]) + self._offset
+        return ts, self._read_frame() if self.render else None, hands[0] if hands else None
+
+    def _read_frame(self):
+        self._frame = reuse(self._frame, (self.height, self.width, 3))
+        if self.recording.frames is None:
+            self._frame.fill(0)
+        else:
+            cv2.resize(self.recording.frames[self.index], (self.width, self.height), dst=self._frame)
+        return self._frame
+
+    def close(self):
+        pass
+
+
+class ScriptedInput:
+    """
+    Synthetic hand: the palm follows a Lissajous curve with seeded speed
+    and phase, and every hold_frames frames a new gesture is picked
+    (GESTURE_WEIGHTS).  frames=None never runs out.
+    """
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, frames=None, seed=None,
+                 fps=TARGET_FPS, hold_frames=60, render=False):
+        self.width = width
+        self.height = height
+        self.frames = frames
+        self.fps = fps
+        self.hold_frames = hold_frames
+        self.render = render
+        self.rng = np.random.default_rng(seed)
+        self.freq = self.rng.uniform(0.2, 0.8, 2)  # Hz, x and y
+        self.phase = self.rng.uniform(0, 2 * np.pi, 2)
+        self.index = -1
+        self.fingers = SCRIPTED_GESTURES["OPEN"]
+        self._frame = None
+
+    def read(self):
+        self.index += 1
+        if self.frames is not None and self.index >= self.frames:
+            return None
+        ts = self.index / self.fps
+        if self.index % self.hold_frames == 0:
+            gesture = self.rng.choice(list(SCRIPTED_GESTURES), p=GESTURE_WEIGHTS)
+            self.fingers = SCRIPTED_GESTURES[gesture]
+
+        sx, sy = np.sin(2 * np.pi * self.freq * ts + self.phase)
+        cx = self.width / 2 + sx * self.width * 0.4
+        cy = self.height / 2 + sy * self.height * 0.3
+        hand = synthetic_hand(cx, cy, self.fingers)
+
+        frame = None
+        if self.render:
+            frame = self._frame = reuse(self._frame, (self.height, self.width, 3))
+            frame.fill(0)
+        return ts, frame, hand
+
+    def close(self):
+        pass
@@ -0,0 +1,123 @@
+"""
+Live hand input for the catching game: camera + MediaPipe hand landmarker.
+
+HandTracker wraps the landmarker with the adaptive DetectionScheduler and
+One-Euro filtering; LiveInput adds the camera and mirroring and exposes
+the read() -> (timestamp, frame, hand) interface of catch_engine inputs.
+"""
+
+import os
+import sys
+import time
+
+import cv2
+import mediapipe as mp
+from mediapipe.tasks import python
+from mediapipe.tasks.python import vision
+
+from catch_engine import SCREEN_HEIGHT, SCREEN_WIDTH, TARGET_FPS, Point
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.detection_scheduler import DetectionScheduler
+from common.landmark_filter import LandmarkFilter
+from common.replay import Recorder
+from common.profiler import FrameProfiler
+from common.model_manager import BackgroundLoader, ensure_model
+from common.frame_prep import FramePrep
+
+
+class HandTracker:
+    """
+    Uses MediaPipe Tasks Hand Landmarker to get index finger tip (landmark 8) and full landmarks.
+    Detection runs on every N-th frame at reduced resolution (see DetectionScheduler);
+    landmarks are One-Euro filtered and predicted forward to the time they are used,
+    so the player circle lines up with the real hand despite inference lag.
+    """
+    def __init__(self, model_path, target_fps=TARGET_FPS):
+        BaseOptions = python.BaseOptions
+        HandLandmarker = vision.HandLandmarker
+        HandLandmarkerOptions = vision.HandLandmarkerOptions
+        VisionRunningMode = vision.RunningMode
+
+        options = HandLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=model_path),
+            running_mode=VisionRunningMode.VIDEO,
+            num_hands=1
+        )
+        self.landmarker = HandLandmarker.create_from_options(options)
+        self.frame_id = 0
+        self.scheduler = DetectionScheduler(target_fps=target_fps,
+                                            landmark_filter=LandmarkFilter())
+        self.raw_hands = []  # unfiltered hand points of the last detection
+        self.prep = FramePrep()  # reused RGB buffer for MediaPipe
+
+    def get_hand(self, frame_bgr):
+        now = time.monotonic()
+
+        if self.scheduler.should_detect():
+            # Convert to RGB (on the downsampled copy), into a reused buffer
+            rgb = self.prep.rgb(self.scheduler.prepare(frame_bgr))
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+
+            start = time.monotonic()
+            result = self.landmarker.detect_for_video(mp_image, self.frame_id)
+            self.scheduler.record_inference((time.monotonic() - start) * 1000)
+
+            if result.hand_landmarks:
+                h, w, _ = frame_bgr.shape
+                points = [(lm.x * w, lm.y * h) for lm in result.hand_landmarks[0]]
+                self.raw_hands = [points]
+            else:
+                self.raw_hands = []
+            self.scheduler.observe(now, self.raw_hands)
+        self.frame_id += 1
+
+        # Predicted to "now" after inference, i.e. forward by the inference latency
+        predicted = self.scheduler.predict(time.monotonic())
+        if predicted:
+            hand = [Point(x, y) for x, y in predicted[0]]
+            return predicted[0][8], hand  # index finger tip
+
+        return None, None
+
+
+class LiveInput:
+    """
+    Camera frames, mirrored, with the tracked hand: read() -> (timestamp,
+    frame, hand or None).  The model loads while the camera warms up.
+    Optionally records frames + raw landmarks for replay.
+    """
+    def __init__(self, camera=0, width=SCREEN_WIDTH, height=SCREEN_HEIGHT,
+                 model_path=None, record_path=None, profiler=None):
+        # Model (local file or per-user cache) loads while the camera warms up
+        loader = BackgroundLoader(lambda: HandTracker(model_path or ensure_model()))
+
+        self.cap = cv2.VideoCapture(camera)
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.prep = FramePrep((width, height))
+        self.raw = None  # cap.read() destination, reused
+        self.recorder = Recorder(record_path) if record_path else None
+        self.profiler = profiler or FrameProfiler(enabled=False)
+        self.tracker = loader.get()
+
+    def read(self):
+        with self.profiler.stage("capture"):
+            ret, self.raw = self.cap.read(self.raw)
+        if not ret:
+            return None
+        ts = time.monotonic()
+
+        # Mirror view (resized only if the camera ignored the requested size)
+        frame = self.prep.mirror(self.raw)
+
+        with self.profiler.stage("detect"):
+            _, hand = self.tracker.get_hand(frame)
+        if self.recorder:
+            self.recorder.add(ts, frame, self.tracker.raw_hands)
+        return ts, frame, hand
+
+    def close(self):
+        if self.recorder:
+            self.recorder.close()
+        self.cap.release()
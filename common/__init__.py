@@ -0,0 +1 @@
+"""Helpers shared by the Day7 particle system and the Day8 catching games."""
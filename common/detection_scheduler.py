@@ -0,0 +1,184 @@
+"""
+Adaptive detection scheduler for hand landmark inference.
+
+Runs MediaPipe only on every N-th frame and on a downsampled copy of the
+frame.  Between detections the landmarks are extrapolated from the last two
+results (constant velocity), or from the filtered velocity when a
+LandmarkFilter is attached.
+
+N and the scale factor follow the measured inference cost
+(record_inference), not the render time: the detection duty
+
+    inference ms / (N * frame budget ms)
+
+is kept below max_duty.  Where detection runs inline in the render loop
+(day8) max_duty is the share of the frame it may take; where it runs on
+its own thread (day7) 1.0 means the model just keeps up with the frames
+it is given.  adapt() is fed the time of every rendered frame, so fps is
+the achieved frame rate, waits for the camera and display included.
+"""
+
+import json
+import threading
+
+import cv2
+import numpy as np
+
+from common.landmark_filter import match_hands
+
+SCALES        = (1.0, 0.75, 0.5, 0.35)   # inference resolution steps, largest first
+NUM_LANDMARKS = 21
+
+
+class DetectionScheduler:
+    def __init__(self, target_fps=30, max_every_n=4, scales=SCALES, max_duty=0.5,
+                 max_extrapolate=0.15, smoothing=0.1, landmark_filter=None):
+        self.frame_budget_ms = 1000.0 / target_fps
+        self.max_duty        = max_duty
+        self.max_every_n     = max_every_n
+        self.scales          = scales
+        self.max_extrapolate = max_extrapolate   # seconds we dare to predict ahead
+        self.smoothing       = smoothing
+        self.landmark_filter = landmark_filter
+
+        # Chosen settings
+        self.every_n   = 1
+        self.scale_idx = 0
+
+        # Measurements
+        self.frame_ms    = 0.0     # smoothed interval between rendered frames
+        self.fps         = 0.0
+        self.infer_ms    = 0.0     # smoothed inference cost
+        self.frames      = 0
+        self.detections  = 0
+        self._last_frame = None
+
+        self._lock    = threading.Lock()
+        self._counter = 0
+        self._small   = None
+        self._prev    = None    # (ts, array of shape (hands, 21, 2))
+        self._last    = None
+        self._velocity = None   # from the landmark filter, if any
+
+    @property
+    def scale(self):
+        return self.scales[self.scale_idx]
+
+    # ─────────────────────────────────────────
+    #  INFERENCE SIDE
+    # ─────────────────────────────────────────
+    def should_detect(self):
+        """True on every N-th call."""
+        self._counter += 1
+        if self._counter >= self.every_n:
+            self._counter = 0
+            return True
+        return False
+
+    def prepare(self, frame):
+        """Downsampled frame for inference (the frame itself at scale 1.0)."""
+        if self.scale == 1.0:
+            return frame
+        h, w = frame.shape[:2]
+        size = (max(1, int(w * self.scale)), max(1, int(h * self.scale)))
+        if self._small is None or self._small.shape[1::-1] != size:
+            self._small = np.empty((size[1], size[0], 3), dtype=frame.dtype)
+        cv2.resize(frame, size, dst=self._small, interpolation=cv2.INTER_AREA)
+        return self._small
+
+    def observe(self, ts, all_hands_data):
+        """Record a detection result (list of hand_points) taken at ts."""
+        points = np.array(all_hands_data, dtype=np.float32).reshape(len(all_hands_data), NUM_LANDMARKS, 2)
+        velocity = None
+        if self.landmark_filter is not None:
+            points   = self.landmark_filter(ts, points).copy()
+            velocity = self.landmark_filter.velocity.copy()
+        with self._lock:
+            self._velocity = velocity
+            self.detections += 1
+            self._prev = None
+            if self._last is not None and velocity is None:
+                # pair hands by wrist, MediaPipe may list them in another order
+                match = match_hands(self._last[1], points)
+                if len(match) and (match >= 0).all():
+                    self._prev = (self._last[0], self._last[1][match])
+            self._last = (ts, points)
+
+    # ─────────────────────────────────────────
+    #  RENDER SIDE
+    # ─────────────────────────────────────────
+    def predict(self, ts):
+        """Hand points at time ts, extrapolated from the last two detections."""
+        with self._lock:
+            last, prev, velocity = self._last, self._prev, self._velocity
+        if last is None:
+            return []
+
+        t1, p1 = last
+        points = p1
+        ahead = min(max(ts - t1, 0.0), self.max_extrapolate)
+        if velocity is not None:
+            points = p1 + velocity * ahead
+        elif prev is not None and t1 > prev[0]:
+            t0, p0 = prev
+            points = p1 + (p1 - p0) * (ahead / (t1 - t0))
+
+        return [[(int(x), int(y)) for x, y in hand] for hand in points.tolist()]
+
+    def record_inference(self, ms):
+        """Feed the cost of one detection (may be called from another thread)."""
+        self.infer_ms = ms if self.infer_ms == 0.0 else self.infer_ms + self.smoothing * (ms - self.infer_ms)
+
+    @property
+    def duty(self):
+        return self.infer_ms / (self.every_n * self.frame_budget_ms)
+
+    def adapt(self, now):
+        """Call once per rendered frame with its time.monotonic(); re-decides N and scale."""
+        if self._last_frame is not None and now > self._last_frame:
+            interval_ms = (now - self._last_frame) * 1000
+            if self.frame_ms == 0.0:
+                self.frame_ms = interval_ms
+            else:
+                self.frame_ms += self.smoothing * (interval_ms - self.frame_ms)
+            self.fps = 1000.0 / self.frame_ms
+        self._last_frame = now
+        self.frames += 1
+
+        # Only re-decide every few frames so the averages can settle
+        if self.frames % 15 or self.infer_ms == 0.0:
+            return
+        if self.duty > self.max_duty:
+            if self.every_n < self.max_every_n:
+                self.every_n += 1
+            elif self.scale_idx < len(self.scales) - 1:
+                self.scale_idx += 1
+        elif self.duty < 0.5 * self.max_duty:
+            if self.scale_idx > 0:
+                self.scale_idx -= 1
+            elif self.every_n > 1:
+                self.every_n -= 1
+
+    # ─────────────────────────────────────────
+    #  REPORTING
+    # ─────────────────────────────────────────
+    def metrics(self):
+        return {
+            "every_n":        self.every_n,
+            "scale":          self.scale,
+            "fps":            round(self.fps, 1),
+            "frame_ms":       round(self.frame_ms, 2),
+            "frame_budget_ms": round(self.frame_budget_ms, 2),
+            "infer_ms":       round(self.infer_ms, 2),
+            "duty":           round(self.duty, 2),
+            "frames":         self.frames,
+            "detections":     self.detections,
+        }
+
+    def hud_text(self):
+        return (f"detect 1/{self.every_n} @ {self.scale:.2f}x  {self.infer_ms:4.1f} ms  "
+                f"{self.fps:5.1f} fps")
+
+    def dump_metrics(self, path):
+        with open(path, "w") as f:
+            json.dump(self.metrics(), f, indent=2)
@@ -0,0 +1,78 @@
+"""
+Vectorized finger-state classification over landmark arrays.
+
+Every function takes points of shape (..., 21, 2) or (..., 21, 3) — one
+hand, all hands of a frame, or a whole recorded sequence — and works on
+all leading dimensions at once.  Finger states are packed into 5-bit codes
+(bit 0 = thumb ... bit 4 = pinky) so gesture lookups are plain array
+indexing into 32-entry tables.
+"""
+
+import numpy as np
+
+NUM_CODES = 32
+
+# Landmark pairs: index tip vs pip (day7) and tip vs mcp base (day8)
+TIPS      = np.array([8, 12, 16, 20])
+PIPS      = np.array([6, 10, 14, 18])
+DAY8_TIPS  = np.array([4, 8, 12, 16, 20])
+DAY8_BASES = np.array([2, 5, 9, 13, 17])
+
+
+def finger_margins(points):
+    """
+    day7 rule before thresholding -> array (..., 5), larger = more "up".
+    Thumb: how much further the tip is from the wrist than joint 2
+    (horizontally); others: pixels the tip is above its pip joint.
+    """
+    points = np.asarray(points)
+    x = points[..., 0]
+    y = points[..., 1]
+
+    margins = np.empty(points.shape[:-2] + (5,), dtype=np.result_type(points.dtype, np.int16))
+    wrist_x = x[..., 0]
+    margins[..., 0] = np.abs(x[..., 4] - wrist_x) - np.abs(x[..., 2] - wrist_x)
+    margins[..., 1:] = y[..., PIPS] - y[..., TIPS]
+    return margins
+
+
+def states_from_margins(margins, threshold=12):
+    """finger_margins -> bool array (..., 5): thumb above 0, the others above threshold."""
+    states = margins > threshold
+    states[..., 0] = margins[..., 0] > 0
+    return states
+
+
+def fingers_up(points, threshold=12):
+    """
+    day7 rule -> bool array (..., 5): thumb, index, middle, ring, pinky.
+    Thumb is a horizontal check against the wrist, the others a vertical
+    tip-above-pip check with a pixel threshold.
+    """
+    return states_from_margins(finger_margins(points), threshold)
+
+
+def fingers_extended(points):
+    """day8 rule (GestureDetector) -> bool array (..., 5): tip.y < base.y."""
+    y = np.asarray(points)[..., 1]
+    return y[..., DAY8_TIPS] < y[..., DAY8_BASES]
+
+
+def pack(states):
+    """Bool finger states (..., 5) -> uint8 gesture codes (...)."""
+    return np.packbits(states, axis=-1, bitorder="little")[..., 0]
+
+
+def code_to_key(code):
+    """5-bit code -> (thumb, index, middle, ring, pinky) tuple of bools."""
+    code = int(code)
+    return tuple(bool(code >> bit & 1) for bit in range(5))
+
+
+def key_to_code(key):
+    return sum(1 << bit for bit, up in enumerate(key) if up)
+
+
+def build_table(lookup):
+    """32-entry list with lookup(key) for every finger combination, indexed by code."""
+    return [lookup(code_to_key(code)) for code in range(NUM_CODES)]
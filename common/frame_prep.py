@@ -0,0 +1,53 @@
+"""
+Camera frame -> display frame -> MediaPipe input, without per-frame allocations.
+
+The games used to run cv2.resize, cv2.flip and cv2.cvtColor(BGR2RGB) each
+into a freshly allocated frame.  FramePrep keeps one destination buffer
+per step and passes it as dst=, and skips the resize when the camera
+already delivers the requested size.  mp.Image copies the pixels it is
+given, so the RGB buffer can be reused as soon as the Image exists.
+"""
+
+import cv2
+import numpy as np
+
+
+def reuse(buf, shape, dtype=np.uint8):
+    """buf if it already has this shape/dtype, else a new empty array."""
+    if buf is None or buf.shape != shape or buf.dtype != dtype:
+        return np.empty(shape, dtype=dtype)
+    return buf
+
+
+class FramePrep:
+    """
+    size: (width, height) the display frame should have, or None to keep
+    the camera size.  passes counts full-frame writes (for benchmarks).
+    """
+
+    def __init__(self, size=None):
+        self.size    = tuple(size) if size else None
+        self.passes  = 0
+        self._sized  = None
+        self._mirror = None
+        self._rgb    = None
+
+    def mirror(self, frame):
+        """Mirrored BGR frame at self.size (resized only if the camera differs)."""
+        h, w = frame.shape[:2]
+        if self.size and (w, h) != self.size:
+            self._sized = reuse(self._sized, (self.size[1], self.size[0]) + frame.shape[2:])
+            cv2.resize(frame, self.size, dst=self._sized)
+            self.passes += 1
+            frame = self._sized
+        self._mirror = reuse(self._mirror, frame.shape)
+        cv2.flip(frame, 1, dst=self._mirror)
+        self.passes += 1
+        return self._mirror
+
+    def rgb(self, frame):
+        """RGB copy of a BGR frame, in a reused buffer."""
+        self._rgb = reuse(self._rgb, frame.shape)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        self.passes += 1
+        return self._rgb
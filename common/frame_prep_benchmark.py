@@ -0,0 +1,90 @@
+"""
+Frame preparation microbenchmark: camera frame -> mirrored BGR + RGB for MediaPipe.
+
+  old -> cv2.resize / cv2.flip / cv2.cvtColor, each returning a new frame
+  new -> FramePrep with reused dst= buffers, resize skipped when the
+         camera already delivers the display size
+
+For each case prints ms per frame, full-frame passes and how many frames'
+worth of memory were allocated per frame (tracemalloc).
+
+Run: python -m common.frame_prep_benchmark
+"""
+
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from common.frame_prep import FramePrep
+
+REPEATS = 200
+
+# (name, camera size, display size)
+CASES = [
+    ("day7 720p",          (1280, 720), None),
+    ("day8 480p",          (640, 480),  (640, 480)),
+    ("day8 720p->480p",    (1280, 720), (640, 480)),
+]
+
+
+def old_prepare(frame, size):
+    if size:
+        frame = cv2.resize(frame, size)
+    frame = cv2.flip(frame, 1)
+    return frame, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+
+def new_prepare(prep):
+    def prepare(frame, size):
+        frame = prep.mirror(frame)
+        return frame, prep.rgb(frame)
+    return prepare
+
+
+def measure(prepare, camera, size):
+    """(ms per frame, frames' worth of memory allocated per frame)"""
+    frame = np.random.default_rng(0).integers(0, 256, (camera[1], camera[0], 3), dtype=np.uint8)
+    prepare(frame, size)   # warm-up, allocates the reused buffers
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        prepare(frame, size)
+    ms = (time.perf_counter() - start) / REPEATS * 1000
+
+    tracemalloc.start()
+    allocated = 0
+    for _ in range(REPEATS):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = prepare(frame, size)
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += max(0, peak - before)
+        del result
+    tracemalloc.stop()
+    out_w, out_h = size or camera
+    return ms, allocated / REPEATS / (out_w * out_h * 3)
+
+
+def old_passes(size):
+    """Full-frame writes per frame: resize (always called in day8) + flip + cvtColor."""
+    return (1 if size else 0) + 2
+
+
+def main():
+    print(f"{'case':<16} | {'old ms':>7} | {'new ms':>7} | {'old passes':>10} | {'new passes':>10} "
+          f"| {'old allocs':>10} | {'new allocs':>10}")
+    print("-" * 92)
+    for name, camera, size in CASES:
+        prep = FramePrep(size)
+        old_ms, old_allocs = measure(old_prepare, camera, size)
+        new_ms, new_allocs = measure(new_prepare(prep), camera, size)
+        new_passes = prep.passes // (2 * REPEATS + 1)   # warm-up + timed + traced runs
+        print(f"{name:<16} | {old_ms:>7.3f} | {new_ms:>7.3f} | {old_passes(size):>10} | {new_passes:>10} "
+              f"| {old_allocs:>10.1f} | {new_allocs:>10.1f}")
+    print("\n(allocs = frames' worth of memory allocated per frame)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+Headless batch gesture classification over labelled landmark datasets.
+
+Streams landmark rows from .csv, .parquet or .npy in chunks, classifies
+them with the vectorized finger-state rules of day7 (finger_states.fingers_up) or
+day8 (GestureDetector), writes the predictions and prints rows per
+second plus a confusion matrix when labels are given.  Chunks are
+parsed and classified in a process pool; a .csv is split into byte ranges
+(one row per line) that each worker reads and parses itself.
+
+Input rows are one hand each:
+  .csv / .parquet  columns x0, y0[, z0] ... x20, y20[, z20] and an
+                   optional label column (--label-column)
+  .npy             array (rows, 21, 2|3) or (rows, 42|63); labels from
+                   a separate .npy (--labels)
+Labels are class names (day8: FIST, OPEN, ...; day7: finger letters
+like "-IM--") or, for day7, packed 5-bit finger codes.  Coordinates are
+normalized 0..1 as MediaPipe returns them; the day7 rule thresholds in
+pixels, so they are scaled to --width x --height first (pass 1 1 for
+datasets already in pixels).
+
+Run from the repo root:
+  python -m common.gesture_batch landmarks.csv --rule day8 --label-column label --out predictions.csv
+"""
+
+import argparse
+import csv
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+import numpy as np
+
+from common import finger_states
+
+ROOT          = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NUM_LANDMARKS = 21
+CHUNK_ROWS    = 100_000
+FRAME_SIZE    = (1280, 720)   # day7 camera frame, for scaling normalized points
+FINGER_LETTERS = "TIMRP"
+COORD_COLUMN  = re.compile(r"^([xyz])(\d+)$")
+
+
+# ─────────────────────────────────────────────
+#  RULES
+# ─────────────────────────────────────────────
+def code_name(code):
+    """Packed finger code -> letters of the raised fingers, e.g. 6 -> "-IM--"."""
+    return "".join(letter if up else "-"
+                   for letter, up in zip(FINGER_LETTERS, finger_states.code_to_key(code)))
+
+
+@lru_cache(maxsize=None)
+def day8_table():
+    """(class names, class index for every finger code) from GestureDetector.label_for"""
+    sys.path.insert(0, os.path.join(ROOT, "Day8"))
+    from catch_engine import GestureDetector
+
+    labels = finger_states.build_table(GestureDetector.label_for)
+    names  = sorted(set(labels))
+    return names, np.array([names.index(label) for label in labels], dtype=np.uint8)
+
+
+def class_names(rule):
+    if rule == "day7":
+        return [code_name(code) for code in range(finger_states.NUM_CODES)]
+    return day8_table()[0]
+
+
+def classify(rule, points, threshold, size=FRAME_SIZE):
+    """points (rows, 21, 2+), normalized -> class index per row (uint8)"""
+    if rule == "day7":
+        pixels = points[..., :2] * np.array(size, dtype=np.float32)
+        return finger_states.pack(finger_states.fingers_up(pixels, threshold))
+    return day8_table()[1][finger_states.pack(finger_states.fingers_extended(points))]
+
+
+def label_indices(rule, labels):
+    """Label values -> class indices, -1 where the label is unknown"""
+    names = {name: i for i, name in enumerate(class_names(rule))}
+    values, inverse = np.unique(np.asarray(labels).astype(str), return_inverse=True)
+    lookup = np.full(len(values), -1, dtype=np.int16)
+    for i, label in enumerate(values.tolist()):   # distinct labels only
+        label = label.strip()
+        if label in names:
+            lookup[i] = names[label]
+        elif rule == "day7" and label.isdigit() and int(label) < finger_states.NUM_CODES:
+            lookup[i] = int(label)
+    return lookup[inverse]
+
+
+# ─────────────────────────────────────────────
+#  READERS
+#  Each yields tasks; run_task() turns a task into a points array + labels
+#  inside the worker, so parsing is spread over the pool as well.
+# ─────────────────────────────────────────────
+def coord_indices(header):
+    """Column index of x_i / y_i for every landmark, from a header row"""
+    found = {}
+    for col, name in enumerate(header):
+        match = COORD_COLUMN.match(name.strip())
+        if match:
+            found[(match.group(1), int(match.group(2)))] = col
+    try:
+        return [[found[(axis, i)] for axis in "xy"] for i in range(NUM_LANDMARKS)]
+    except KeyError as e:
+        raise ValueError(f"Missing landmark column {e.args[0][0]}{e.args[0][1]}") from None
+
+
+def csv_tasks(path, chunk_rows, label_column):
+    """Byte ranges of about chunk_rows lines, cut at line starts; only the header is parsed here."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8")]))
+        cols   = coord_indices(header)
+        label  = header.index(label_column) if label_column else None
+        start  = f.tell()
+        sample = list(islice(f, 1000))
+        chunk_bytes = chunk_rows * max(1, sum(map(len, sample)) // max(1, len(sample)))
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()   # on to the start of the next line
+            stop = f.tell()
+            yield ("csv", path, start, stop, cols, label)
+            start = stop
+
+
+def npy_tasks(path, chunk_rows, labels_path):
+    rows = np.load(path, mmap_mode="r").shape[0]
+    for start in range(0, rows, chunk_rows):
+        yield ("npy", path, start, min(start + chunk_rows, rows), labels_path)
+
+
+def parquet_tasks(path, chunk_rows, label_column):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("Reading .parquet needs pyarrow (pip install pyarrow)") from None
+    meta = pq.ParquetFile(path).metadata
+    for group in range(meta.num_row_groups):
+        yield ("parquet", path, group, label_column)
+
+
+def run_task(task, rule, threshold, size=FRAME_SIZE):
+    """-> (class index per row, label index per row or None)"""
+    kind = task[0]
+    labels = None
+    if kind == "csv":
+        _, path, start, stop, cols, label = task
+        with open(path, "rb") as f:
+            f.seek(start)
+            lines = f.read(stop - start).decode("utf-8").splitlines()
+        rows   = [row for row in csv.reader(lines) if row]
+        if not rows:   # a range of trailing blank lines
+            return np.zeros(0, np.uint8), None if label is None else np.zeros(0, np.int16)
+        table  = np.array(rows)
+        points = table[:, cols].astype(np.float32)
+        if label is not None:
+            labels = table[:, label]
+    elif kind == "npy":
+        _, path, start, stop, labels_path = task
+        points = np.asarray(np.load(path, mmap_mode="r")[start:stop], dtype=np.float32)
+        points = points.reshape(len(points), NUM_LANDMARKS, -1)
+        if labels_path:
+            labels = np.load(labels_path, mmap_mode="r")[start:stop]
+    else:
+        import pyarrow.parquet as pq
+        _, path, group, label_column = task
+        batch  = pq.ParquetFile(path).read_row_group(group)
+        cols   = coord_indices(batch.column_names)
+        names  = batch.column_names
+        points = np.stack([np.stack([batch.column(names[c]).to_numpy() for c in pair], axis=-1)
+                           for pair in cols], axis=1).astype(np.float32)
+        if label_column:
+            labels = batch.column(label_column).to_numpy()
+
+    predicted = classify(rule, points, threshold, size)
+    return predicted, None if labels is None else label_indices(rule, labels)
+
+
+def tasks_for(path, chunk_rows, label_column, labels_path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return csv_tasks(path, chunk_rows, label_column)
+    if ext == ".npy":
+        return npy_tasks(path, chunk_rows, labels_path)
+    if ext == ".parquet":
+        return parquet_tasks(path, chunk_rows, label_column)
+    raise SystemExit(f"Unsupported input format: {ext} (use .csv, .parquet or .npy)")
+
+
+def ordered_results(pool, tasks, rule, threshold, size, in_flight):
+    """pool.map that keeps at most in_flight chunks in memory"""
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.submit(run_task, task, rule, threshold, size))
+        if len(pending) >= in_flight:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+# ─────────────────────────────────────────────
+#  OUTPUT
+# ─────────────────────────────────────────────
+class PredictionWriter:
+    """.npy (class indices) or .csv (one class name per row)"""
+
+    def __init__(self, path, names):
+        self.path   = path
+        self.names  = np.array(names)
+        self.chunks = []
+        self._csv   = None
+        if path and path.lower().endswith(".csv"):
+            self._csv = open(path, "w", newline="")
+            self._csv.write("predicted\n")
+
+    def write(self, predicted):
+        if self._csv:
+            self._csv.write("\n".join(self.names[predicted].tolist()) + "\n")
+        elif self.path:
+            self.chunks.append(predicted)
+
+    def close(self):
+        if self._csv:
+            self._csv.close()
+        elif self.path:
+            np.save(self.path, np.concatenate(self.chunks) if self.chunks else np.zeros(0, np.uint8))
+
+
+def print_confusion(confusion, names, top=10):
+    total   = confusion.sum()
+    correct = np.trace(confusion)
+    print(f"labelled rows: {total:,}   accuracy: {correct / total:.2%}" if total else "no labelled rows")
+    if not total:
+        return
+    if len(names) <= 8:
+        width = max(len(n) for n in names) + 1
+        print("\nconfusion (rows = label, columns = predicted)")
+        print(" " * width + "".join(f"{n:>{width}}" for n in names))
+        for name, row in zip(names, confusion):
+            print(f"{name:<{width}}" + "".join(f"{v:>{width}}" for v in row))
+        return
+    off = confusion.copy()
+    np.fill_diagonal(off, 0)
+    order = np.argsort(off, axis=None)[::-1][:top]
+    print("\ntop confusions (label -> predicted)")
+    for flat in order:
+        label, pred = divmod(int(flat), len(names))
+        if off[label, pred]:
+            print(f"  {names[label]} -> {names[pred]}: {off[label, pred]:,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("input", help=".csv, .parquet or .npy landmark rows")
+    parser.add_argument("--rule", choices=("day7", "day8"), default="day8")
+    parser.add_argument("--threshold", type=float, default=12, help="day7 tip-above-pip threshold (pixels)")
+    parser.add_argument("--width", type=float, default=FRAME_SIZE[0],
+                        help="day7: frame width the normalized x is scaled to (1 = input already in pixels)")
+    parser.add_argument("--height", type=float, default=FRAME_SIZE[1],
+                        help="day7: frame height the normalized y is scaled to (1 = input already in pixels)")
+    parser.add_argument("--label-column", default=None, help="label column of a .csv / .parquet input")
+    parser.add_argument("--labels", default=None, help="labels .npy for a .npy input")
+    parser.add_argument("--out", default=None, help="write predictions to .npy (class indices) or .csv (names)")
+    parser.add_argument("--confusion", default=None, help="write the full confusion matrix to this .csv")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    names     = class_names(args.rule)
+    confusion = np.zeros((len(names), len(names)), dtype=np.int64)
+    writer    = PredictionWriter(args.out, names)
+    rows      = 0
+
+    start = time.perf_counter()
+    tasks = tasks_for(args.input, args.chunk_rows, args.label_column, args.labels)
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for predicted, labels in ordered_results(pool, tasks, args.rule, args.threshold,
+                                                   (args.width, args.height), args.workers * 2):
+            rows += len(predicted)
+            writer.write(predicted)
+            if labels is not None:
+                known = labels >= 0
+                confusion += np.bincount(labels[known].astype(np.int64) * len(names) + predicted[known],
+                                         minlength=len(names) ** 2).reshape(confusion.shape)
+    writer.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"{rows:,} rows in {elapsed:.2f} s -> {rows / elapsed:,.0f} rows/s ({args.workers} workers)")
+    print_confusion(confusion, names)
+    if args.confusion:
+        with open(args.confusion, "w", newline="") as f:
+            out = csv.writer(f)
+            out.writerow(["label"] + names)
+            for name, row in zip(names, confusion.tolist()):
+                out.writerow([name] + row)
+    if args.out:
+        print(f"predictions written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
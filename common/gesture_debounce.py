@@ -0,0 +1,139 @@
+"""
+Per-hand gesture debouncing with hysteresis and a hold time.
+
+The plain day7 rule flips a finger whenever its tip crosses a fixed
+12 px line, so a finger resting near the line flickers and the gesture
+(HUD text, colour, force program) changes every few frames.  Here each
+finger only goes up once it is clearly up (margin > up_px) and only goes
+down once it is clearly down (margin < down_px), and a new finger code
+has to stay for `hold` seconds before it is confirmed.  Listeners are
+called on confirmed transitions only.
+
+Event rates of the plain rule and of the confirmed gestures are counted
+so the HUD can show how much churn is removed.
+"""
+
+from collections import deque
+
+import numpy as np
+
+from common import finger_states
+from common.landmark_filter import match_hands
+
+# Margins in pixels (see finger_states.finger_margins)
+UP_PX      = 18        # index..pinky count as up above this
+DOWN_PX    = 6         # ... and as down again below this
+THUMB_PX   = 6         # thumb: up above +THUMB_PX, down below -THUMB_PX
+HOLD       = 0.1       # seconds a new finger code must persist
+PLAIN_PX   = 12        # the old fixed threshold, for the churn comparison
+RATE_SPAN  = 5.0       # seconds of events the rates are averaged over
+NUM_LANDMARKS = 21
+
+
+class GestureDebouncer:
+    """
+    update(ts, all_hands_data) -> confirmed finger code per hand (uint8).
+    Hands are matched to the previous update by wrist position (match_hands),
+    so two hands that swap places in the list keep their own state.
+    on_change(hand, old_code, new_code, ts) is called for every confirmed
+    transition; old_code is None for a hand that just appeared.
+    """
+
+    def __init__(self, up_px=UP_PX, down_px=DOWN_PX, thumb_px=THUMB_PX, hold=HOLD, on_change=None):
+        self.up_px   = np.array([thumb_px] + [up_px] * 4)
+        self.down_px = np.array([-thumb_px] + [down_px] * 4)
+        self.hold    = hold
+        self.listeners = [on_change] if on_change else []
+
+        self.fingers   = np.zeros((0, 5), dtype=bool)    # hysteresis state
+        self.candidate = np.zeros(0, dtype=np.uint8)
+        self.since     = np.zeros(0, dtype=np.float64)
+        self.confirmed = np.zeros(0, dtype=np.uint8)
+        self.plain     = np.zeros(0, dtype=np.uint8)     # codes of the plain 12 px rule
+        self.points    = None                            # hands of the last update, for matching
+        self.changed   = False   # any transition (or hand count change) in the last update
+
+        self._plain_events     = deque()
+        self._confirmed_events = deque()
+
+    def _follow(self, match):
+        """Reorder the state to follow the matched hands; unmatched hands start unset."""
+        fresh = match < 0
+        source = np.where(fresh, 0, match)
+
+        def take(array):
+            if len(array):
+                out = array[source]
+            else:
+                out = np.zeros((len(match),) + array.shape[1:], dtype=array.dtype)
+            out[fresh] = 0
+            return out
+
+        self.fingers   = take(self.fingers)
+        self.candidate = take(self.candidate)
+        self.since     = take(self.since)
+        self.confirmed = take(self.confirmed)
+        self.plain     = take(self.plain)
+        return fresh
+
+    def update(self, ts, all_hands_data):
+        points = np.asarray(all_hands_data, dtype=np.float64).reshape(-1, NUM_LANDMARKS, 2)
+        match  = match_hands(self.points, points)
+        self.changed = len(points) != len(self.confirmed) or bool((match != np.arange(len(points))).any())
+        fresh = self._follow(match)
+        self.points = points
+        if len(points) == 0:
+            self._count(self._plain_events, ts, 0)
+            self._count(self._confirmed_events, ts, 0)
+            return self.confirmed
+
+        margins = finger_states.finger_margins(points)
+
+        # Plain rule, only to count how often it would have flipped
+        plain = finger_states.pack(finger_states.states_from_margins(margins, PLAIN_PX))
+        self._count(self._plain_events, ts, np.count_nonzero((plain != self.plain) & ~fresh))
+        self.plain = plain
+
+        # Hysteresis: clearly up / clearly down, otherwise keep the last state;
+        # new hands start from the midpoint between the two thresholds
+        midpoint = margins > (self.up_px + self.down_px) / 2
+        self.fingers[fresh] = midpoint[fresh]
+        self.fingers = np.where(margins > self.up_px, True,
+                                np.where(margins < self.down_px, False, self.fingers))
+        raw = finger_states.pack(self.fingers)
+
+        # Hold time: a code is confirmed once it has been the candidate long enough
+        moved = (raw != self.candidate) | fresh
+        self.candidate[moved] = raw[moved]
+        self.since[moved] = ts
+        ready = ~fresh & (raw != self.confirmed) & (ts - self.since >= self.hold)
+
+        for hand in np.flatnonzero(fresh):
+            self.confirmed[hand] = raw[hand]
+            self._notify(int(hand), None, int(raw[hand]), ts)
+        for hand in np.flatnonzero(ready):
+            old = int(self.confirmed[hand])
+            self.confirmed[hand] = raw[hand]
+            self._notify(int(hand), old, int(raw[hand]), ts)
+        self._count(self._confirmed_events, ts, np.count_nonzero(ready))
+        self.changed |= bool(fresh.any() or ready.any())
+        return self.confirmed
+
+    def _notify(self, hand, old, new, ts):
+        for listener in self.listeners:
+            listener(hand, old, new, ts)
+
+    def _count(self, events, ts, n):
+        if n:
+            events.append((ts, n))
+        while events and events[0][0] < ts - RATE_SPAN:
+            events.popleft()
+
+    def rates(self):
+        """(plain rule flips per second, confirmed transitions per second)"""
+        return (sum(n for _, n in self._plain_events) / RATE_SPAN,
+                sum(n for _, n in self._confirmed_events) / RATE_SPAN)
+
+    def hud_text(self):
+        plain, confirmed = self.rates()
+        return f"gesture events/s: {plain:4.1f} raw -> {confirmed:4.1f} confirmed"
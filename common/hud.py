@@ -0,0 +1,93 @@
+"""
+Cached HUD text.
+
+cv2.putText rasterizes the Hershey strokes of every glyph on every call.
+TextCache renders each distinct (text, scale, colour, thickness) once
+into a small sprite with a mask and afterwards only copies the masked
+pixels into the frame.  putText's default LINE_8 drawing has hard edges,
+so the 0/1 mask reproduces it pixel for pixel.
+
+OpenCV 5 renders antialiased glyphs instead, blending each one into the
+frame in turn; a cached mask cannot match that where glyphs overlap, and
+the new renderer is fast anyway, so there put() is plain cv2.putText.
+
+The frame under the HUD is a new camera frame every time, so the sprites
+are still copied in every frame; what is saved is the rasterization.
+"""
+
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+
+def hard_edged(font=FONT):
+    """True if putText draws 0/1 pixels (OpenCV 4 LINE_8), so a mask reproduces it exactly."""
+    probe = np.zeros((40, 80), dtype=np.uint8)
+    cv2.putText(probe, "Ag", (5, 30), font, 1.0, 255, 2)
+    return bool(np.isin(probe, (0, 255)).all())
+
+
+class TextCache:
+    """Least-recently-used cache of text sprites; put() is a drop-in for cv2.putText."""
+
+    def __init__(self, max_entries=256, font=FONT):
+        self.font        = font
+        self.max_entries = max_entries
+        self.hits        = 0
+        self.misses      = 0
+        self.cached      = hard_edged(font)   # False: put() passes straight to cv2.putText
+        self._sprites    = OrderedDict()
+
+    def _render(self, text, scale, color, thickness):
+        """(colour patch, bool mask, dx, dy): top-left of the patch relative to org."""
+        (w, h), baseline = cv2.getTextSize(text, self.font, scale, thickness)
+        pad = thickness + 2
+        mask = np.zeros((h + baseline + 2 * pad, w + 2 * pad), dtype=np.uint8)
+        cv2.putText(mask, text, (pad, h + pad), self.font, scale, 255, thickness)
+
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        if len(rows) == 0:
+            return None
+        r0, r1 = rows[0], rows[-1] + 1
+        c0, c1 = cols[0], cols[-1] + 1
+        mask = mask[r0:r1, c0:c1, None] > 0
+        patch = np.empty((r1 - r0, c1 - c0, 3), dtype=np.uint8)
+        patch[:] = color
+        return patch, mask, c0 - pad, r0 - (h + pad)
+
+    def sprite(self, text, scale, color, thickness=1):
+        key = (text, scale, tuple(color), thickness)
+        entry = self._sprites.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self._sprites[key] = self._render(text, scale, key[2], thickness)
+            if len(self._sprites) > self.max_entries:
+                self._sprites.popitem(last=False)
+        else:
+            self.hits += 1
+            self._sprites.move_to_end(key)
+        return entry
+
+    def put(self, frame, text, org, scale, color, thickness=1):
+        """Same pixels as cv2.putText(frame, text, org, self.font, scale, color, thickness)."""
+        if not self.cached:
+            cv2.putText(frame, text, org, self.font, scale, color, thickness)
+            return
+        entry = self.sprite(text, scale, color, thickness)
+        if entry is None:
+            return
+        patch, mask, dx, dy = entry
+        x0, y0 = org[0] + dx, org[1] + dy
+        h, w = patch.shape[:2]
+        fx0, fy0 = max(x0, 0), max(y0, 0)
+        fx1, fy1 = min(x0 + w, frame.shape[1]), min(y0 + h, frame.shape[0])
+        if fx0 >= fx1 or fy0 >= fy1:
+            return
+        sx, sy = fx0 - x0, fy0 - y0
+        np.copyto(frame[fy0:fy1, fx0:fx1],
+                  patch[sy:sy + fy1 - fy0, sx:sx + fx1 - fx0],
+                  where=mask[sy:sy + fy1 - fy0, sx:sx + fx1 - fx0])
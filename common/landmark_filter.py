@@ -0,0 +1,90 @@
+"""
+One-Euro smoothing filter for hand landmarks.
+
+Works on whole arrays of shape (hands, 21, 2) at once.  Slow movements get
+a low cutoff (jitter removed), fast movements a high one (little lag).  The
+filtered velocity is kept so positions can be predicted forward by the
+pipeline latency.
+
+MediaPipe's hand order is not stable between detections, so each new hand
+is matched to the previous hand with the nearest wrist (match_hands)
+before it is filtered against it.
+"""
+
+import math
+
+import numpy as np
+
+WRIST      = 0
+MATCH_DIST = 250.0     # farthest a wrist may move between detections and keep its track
+
+
+def match_hands(prev, points, max_dist=MATCH_DIST):
+    """
+    Index into prev (hands, 21, 2) of the hand each hand in points continues,
+    or -1 for a new hand.  Nearest wrists are paired first, so two hands that
+    swap places in the detection list keep their own tracks.
+    """
+    match = np.full(len(points), -1)
+    if prev is None or len(prev) == 0 or len(points) == 0:
+        return match
+    dist = np.linalg.norm(points[:, None, WRIST] - prev[None, :, WRIST], axis=-1)
+    taken = set()
+    for flat in np.argsort(dist, axis=None).tolist():
+        i, j = divmod(flat, dist.shape[1])
+        if dist[i, j] > max_dist:
+            break
+        if match[i] < 0 and j not in taken:
+            match[i] = j
+            taken.add(j)
+    return match
+
+
+def smoothing_factor(cutoff, dt):
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class LandmarkFilter:
+    def __init__(self, min_cutoff=1.0, beta=0.02, d_cutoff=1.0):
+        self.min_cutoff = min_cutoff
+        self.beta       = beta
+        self.d_cutoff   = d_cutoff
+        self.reset()
+
+    def reset(self):
+        self.ts       = None
+        self.points   = None    # filtered positions, (hands, 21, 2)
+        self.velocity = None    # filtered velocity in units per second
+
+    def __call__(self, ts, points):
+        """Filter one detection taken at ts; returns the smoothed points in its hand order."""
+        points = np.asarray(points, dtype=np.float32)
+
+        # First call or a clock step back: nothing to smooth against
+        if self.points is None or ts <= self.ts:
+            self.ts       = ts
+            self.points   = points.copy()
+            self.velocity = np.zeros_like(points)
+            return self.points
+
+        # Previous state of the same hand; new hands start from their own position
+        match    = match_hands(self.points, points)
+        known    = match >= 0
+        prev     = points.copy()
+        velocity = np.zeros_like(points)
+        prev[known]     = self.points[match[known]]
+        velocity[known] = self.velocity[match[known]]
+
+        dt = ts - self.ts
+        raw_velocity = (points - prev) / dt
+        a_d = smoothing_factor(self.d_cutoff, dt)
+        velocity += a_d * (raw_velocity - velocity)
+
+        cutoff = self.min_cutoff + self.beta * np.abs(velocity)
+        a = smoothing_factor(cutoff, dt)
+        prev += a * (points - prev)
+        self.points   = prev
+        self.velocity = velocity
+        self.ts = ts
+        return self.points
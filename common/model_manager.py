@@ -0,0 +1,149 @@
+"""
+Cached hand-landmarker model download and background loading.
+
+The model is downloaded once into a per-user cache directory, streamed to
+disk in chunks over a verified TLS connection, checked against the pinned
+SHA-256 of the published model and moved into place atomically.  Later
+runs (also offline) load it straight from the cache after checking it
+again.  A mismatch is an error; trust_on_first_use=True is the explicit
+opt-out for models without a pinned checksum.  BackgroundLoader builds
+the landmarker on a worker thread so the camera can warm up at the same
+time.
+
+MODEL_SHA256 has not been checked against the published file yet, so a
+model that already sits next to the script is trusted on first use
+instead of being rejected: its digest is recorded and checked from then on.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import urllib.request
+
+MODEL_URL  = "https://storage.googleapis.com/mediapipe-models/hand_landmarker/hand_landmarker/float16/1/hand_landmarker.task"
+MODEL_SHA256 = "fbc2a30080c3c557093b5ddfc334698132eb341044ccee322ccf8bcf3607cde1"   # float16/1, unverified
+MODEL_NAME = "hand_landmarker.task"
+CHUNK_SIZE = 64 * 1024
+
+
+def cache_dir():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "hand-gestures")
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def download(url, dest, sha256=None):
+    """Stream url to dest, verifying the SHA-256 if given; returns the hex digest."""
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    digest = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(dest), suffix=".part")
+    try:
+        with urllib.request.urlopen(url, timeout=30) as r, os.fdopen(fd, "wb") as f:
+            for chunk in iter(lambda: r.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+                f.write(chunk)
+        if sha256 and digest.hexdigest() != sha256:
+            raise ValueError(f"Checksum mismatch for {url}: {digest.hexdigest()} != {sha256}")
+        os.replace(tmp_path, dest)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return digest.hexdigest()
+
+
+def ensure_model(url=MODEL_URL, sha256=MODEL_SHA256, local_path=MODEL_NAME, trust_on_first_use=False):
+    """
+    Path to a verified model file.
+
+    A file at local_path (the old "model next to the script" setup) wins,
+    otherwise the cached copy, otherwise a fresh download; each must match
+    sha256 or ValueError is raised.  With trust_on_first_use=True and no
+    sha256, the checksum of the first download is recorded next to it and
+    later runs check the cache against that instead.
+
+    A local_path file that does not match sha256 is trusted on first use
+    with a warning (it worked before the checksum was pinned); only a
+    change after that is an error.
+    """
+    if sha256 is None and not trust_on_first_use:
+        raise ValueError(f"No checksum pinned for {url}: pass sha256, or trust_on_first_use=True")
+
+    if local_path and os.path.exists(local_path):
+        if sha256 and file_sha256(local_path) != sha256:
+            trust_local(local_path)
+        return local_path
+
+    path     = os.path.join(cache_dir(), os.path.basename(url))
+    sum_path = path + ".sha256"
+    if os.path.exists(path):
+        expected = sha256
+        if expected is None and os.path.exists(sum_path):
+            with open(sum_path) as f:
+                expected = f.read().strip()
+        if expected is None or file_sha256(path) == expected:
+            return path
+        print("Cached model does not match its checksum, downloading again...")
+
+    print("Downloading hand model... please wait")
+    digest = download(url, path, sha256)
+    with open(sum_path, "w") as f:
+        f.write(digest)
+    print(f"Model downloaded to {path}")
+    return path
+
+
+def trust_local(path):
+    """Check path against the digest recorded next to it, recording it on first use."""
+    sum_path = path + ".sha256"
+    digest = file_sha256(path)
+    if os.path.exists(sum_path):
+        with open(sum_path) as f:
+            expected = f.read().strip()
+        if digest != expected:
+            raise ValueError(f"Checksum mismatch for {path}: {digest} != {expected} (recorded in {sum_path})")
+        return
+    print(f"Warning: {path} does not match the pinned checksum; trusting it and recording "
+          f"its checksum in {sum_path}")
+    with open(sum_path, "w") as f:
+        f.write(digest)
+
+
+def clear_cache():
+    shutil.rmtree(cache_dir(), ignore_errors=True)
+
+
+class BackgroundLoader:
+    """Runs fn(*args) on a daemon thread; get() waits for and returns its result."""
+
+    def __init__(self, fn, *args, **kwargs):
+        self._result = None
+        self._error  = None
+        self._thread = threading.Thread(target=self._run, args=(fn, args, kwargs), daemon=True)
+        self._thread.start()
+
+    def _run(self, fn, args, kwargs):
+        try:
+            self._result = fn(*args, **kwargs)
+        except BaseException as e:
+            self._error = e
+
+    def ready(self):
+        return not self._thread.is_alive()
+
+    def get(self, timeout=None):
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise TimeoutError("Background load still running")
+        if self._error is not None:
+            raise self._error
+        return self._result
@@ -0,0 +1,134 @@
+"""
+Per-stage frame-time profiler for the OpenCV loops.
+
+    profiler = FrameProfiler()
+    with profiler.stage("detect"):
+        ...
+    profiler.end_frame()
+
+Keeps a rolling window of samples per stage for p50 / p95 / p99, can draw
+a small table + frame-time graph into the output image, and exports a
+CSV or JSON summary.  A disabled profiler hands out one shared no-op
+context manager, so the instrumentation costs next to nothing.
+"""
+
+import csv
+import json
+import time
+from collections import deque
+
+import cv2
+
+PERCENTILES = (50, 95, 99)
+
+
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("samples", "start")
+
+    def __init__(self, samples):
+        self.samples = samples
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.samples.append((time.perf_counter() - self.start) * 1000)
+        return False
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q / 100))]
+
+
+class FrameProfiler:
+    def __init__(self, enabled=True, window=300, budget_ms=1000 / 30):
+        self.enabled   = enabled
+        self.window    = window
+        self.budget_ms = budget_ms
+        self.stages    = {}                      # name -> deque of ms, in first-seen order
+        self.counts    = {}
+        self.frame_ms  = deque(maxlen=window)
+        self._frame_start = time.perf_counter()
+
+    def stage(self, name):
+        if not self.enabled:
+            return _NULL_STAGE
+        samples = self.stages.get(name)
+        if samples is None:
+            samples = self.stages[name] = deque(maxlen=self.window)
+        self.counts[name] = self.counts.get(name, 0) + 1
+        return _Stage(samples)
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.frame_ms.append((now - self._frame_start) * 1000)
+        self._frame_start = now
+
+    # ─────────────────────────────────────────
+    #  REPORTING
+    # ─────────────────────────────────────────
+    def summary(self):
+        """{stage: {count, mean, p50, p95, p99}} in ms, plus the whole frame."""
+        rows = dict(self.stages)
+        rows["frame"] = self.frame_ms
+        result = {}
+        for name, samples in rows.items():
+            values = sorted(samples)
+            stats = {"count": self.counts.get(name, len(values)),
+                     "mean": sum(values) / len(values) if values else 0.0}
+            for q in PERCENTILES:
+                stats[f"p{q}"] = percentile(values, q)
+            result[name] = stats
+        return result
+
+    def draw(self, frame, x, y, graph_w=240, graph_h=60):
+        """Stage table and frame-time graph with the budget line, top-left at (x, y)."""
+        if not self.enabled:
+            return
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        summary = self.summary()
+        for n, (name, stats) in enumerate(summary.items()):
+            line = f"{name:<9}{stats['p50']:6.1f}{stats['p95']:6.1f}{stats['p99']:6.1f} ms"
+            cv2.putText(frame, line, (x, y + n * 18), font, 0.45, (150, 150, 150), 1)
+
+        top = y + len(summary) * 18
+        bottom = top + graph_h
+        cv2.rectangle(frame, (x, top), (x + graph_w, bottom), (60, 60, 60), 1)
+        scale = graph_h / (2 * self.budget_ms)
+        budget_y = int(bottom - self.budget_ms * scale)
+        cv2.line(frame, (x, budget_y), (x + graph_w, budget_y), (0, 120, 255), 1)
+        history = list(self.frame_ms)[-graph_w:]
+        for i, ms in enumerate(history):
+            bar_top = max(top, int(bottom - ms * scale))
+            color = (0, 200, 0) if ms <= self.budget_ms else (0, 0, 255)
+            cv2.line(frame, (x + i, bottom), (x + i, bar_top), color, 1)
+
+    def export(self, path):
+        """Write the summary as .csv or .json (by file extension)."""
+        summary = self.summary()
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["stage", "count", "mean_ms"] + [f"p{q}_ms" for q in PERCENTILES])
+                for name, stats in summary.items():
+                    writer.writerow([name, stats["count"], round(stats["mean"], 3)]
+                                    + [round(stats[f"p{q}"], 3) for q in PERCENTILES])
+        else:
+            with open(path, "w") as f:
+                json.dump(summary, f, indent=2)
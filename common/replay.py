@@ -0,0 +1,125 @@
+"""
+Record-and-replay of camera frames and detected hand landmarks.
+
+A recording is two files next to each other:
+  <path>.frames  raw uint8 BGR frames, back to back (read back memory-mapped)
+  <path>.npz     timestamps, hand counts, landmarks normalised to 0..1, frame shape
+
+ReplayCapture and ReplayDetector stand in for cv2.VideoCapture and the
+MediaPipe detector, so the game loops run with no camera, no model and
+no window.
+"""
+
+import os
+
+import numpy as np
+
+NUM_LANDMARKS = 21
+
+
+class Recorder:
+    def __init__(self, path):
+        self.path        = path
+        self.frame_shape = None
+        self.timestamps  = []
+        self.hands       = []
+        self._frames     = open(path + ".frames", "wb")
+
+    def add(self, ts, frame, all_hands_data):
+        """Append one frame and the hand points (pixel coordinates) detected on it."""
+        if self.frame_shape is None:
+            self.frame_shape = frame.shape
+        elif frame.shape != self.frame_shape:
+            raise ValueError(f"Frame size changed during recording: {frame.shape} != {self.frame_shape}")
+
+        self._frames.write(np.ascontiguousarray(frame, dtype=np.uint8))
+        h, w = frame.shape[:2]
+        points = np.array(all_hands_data, dtype=np.float32).reshape(len(all_hands_data), NUM_LANDMARKS, 2)
+        self.timestamps.append(ts)
+        self.hands.append(points / np.array([w, h], dtype=np.float32))
+
+    def close(self):
+        self._frames.close()
+        count     = len(self.hands)
+        max_hands = max((len(h) for h in self.hands), default=0)
+        landmarks = np.zeros((count, max_hands, NUM_LANDMARKS, 2), dtype=np.float32)
+        for i, points in enumerate(self.hands):
+            landmarks[i, :len(points)] = points
+        np.savez_compressed(
+            self.path + ".npz",
+            timestamps=np.array(self.timestamps, dtype=np.float64),
+            hand_counts=np.array([len(h) for h in self.hands], dtype=np.uint8),
+            landmarks=landmarks,
+            frame_shape=np.array(self.frame_shape or (0, 0, 3)),
+        )
+        print(f"Recorded {count} frames to {self.path}.frames / .npz")
+
+
+class Recording:
+    def __init__(self, path):
+        meta = np.load(path + ".npz")
+        self.timestamps  = meta["timestamps"]
+        self.hand_counts = meta["hand_counts"]
+        self.landmarks   = meta["landmarks"]
+        self.frame_shape = tuple(meta["frame_shape"])
+        # Landmark-only use (headless games) works without the .frames file
+        self.frames = None
+        if os.path.exists(path + ".frames"):
+            self.frames = np.memmap(path + ".frames", dtype=np.uint8, mode="r",
+                                    shape=(len(self.timestamps),) + self.frame_shape)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def hands(self, index, width, height):
+        """Hand points of frame `index`, scaled to a width x height canvas."""
+        points = self.landmarks[index, :self.hand_counts[index]] * np.array([width, height])
+        return [[(int(x), int(y)) for x, y in hand] for hand in points.tolist()]
+
+
+class ReplayCapture:
+    """Drop-in for cv2.VideoCapture that plays a Recording back."""
+
+    def __init__(self, recording, loop=False):
+        self.recording = recording
+        self.loop      = loop
+        self.index     = -1    # index of the frame returned by the last read()
+
+    def isOpened(self):
+        return self.recording.frames is not None and len(self.recording) > 0
+
+    def set(self, prop, value):
+        return False
+
+    def read(self, image=None):
+        """Like cv2.VideoCapture.read: fills image in place when it has the right shape."""
+        next_index = self.index + 1
+        if next_index >= len(self.recording):
+            if not self.loop:
+                return False, None
+            next_index = 0
+        self.index = next_index
+        frame = self.recording.frames[next_index]
+        if image is not None and image.shape == frame.shape:
+            np.copyto(image, frame)
+            return True, image
+        return True, np.array(frame)
+
+    def release(self):
+        pass
+
+
+class ReplayDetector:
+    """Returns the recorded hand points for whatever frame the capture last returned."""
+
+    def __init__(self, capture, width, height):
+        self.capture = capture
+        self.width   = width
+        self.height  = height
+        self.dropped = 0
+
+    def detect(self, frame, ts):
+        return self.capture.recording.hands(self.capture.index, self.width, self.height)
+
+    def close(self):
+        pass
@@ -0,0 +1,138 @@
+"""
+Headless benchmark of the day7 and day8 loops on a recorded session.
+
+Feeds a recording (see common/replay.py) through each game with no camera,
+no model and no window, and reports the mean and p95 time per stage:
+capture, inference, classify, simulate, render.
+
+Run from the repo root:
+  python -m common.replay_benchmark path/to/recording [--frames 500]
+"""
+
+import argparse
+import os
+import sys
+
+import cv2
+import numpy as np
+
+from common import finger_states
+from common.profiler import FrameProfiler
+from common.replay import Recording, ReplayCapture, ReplayDetector
+
+ROOT   = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STAGES = ("capture", "inference", "classify", "simulate", "render")
+DAY7_SIZE      = (1280, 720)
+DAY7_PARTICLES = 800
+
+
+def read_frame(cap, size):
+    ret, frame = cap.read()
+    if ret and frame.shape[1::-1] != size:
+        frame = cv2.resize(frame, size)
+    return ret, frame
+
+
+# ─────────────────────────────────────────────
+#  GAME LOOPS (one frame each, split into stages)
+# ─────────────────────────────────────────────
+def run_day7(recording, limit):
+    sys.path.insert(0, os.path.join(ROOT, "Day7"))
+    from compositor import Compositor
+    from particle_engine import ParticleSystem
+
+    width, height = DAY7_SIZE
+    cap        = ReplayCapture(recording, loop=True)
+    detector   = ReplayDetector(cap, width, height)
+    particles  = ParticleSystem(DAY7_PARTICLES, width, height, seed=0)
+    compositor = Compositor(width, height)
+    profiler   = FrameProfiler(window=limit)
+
+    for _ in range(limit):
+        with profiler.stage("capture"):
+            ret, frame = read_frame(cap, DAY7_SIZE)
+        if not ret:
+            break
+        with profiler.stage("inference"):
+            hands = detector.detect(frame, 0)
+        with profiler.stage("classify"):
+            key = (False,) * 5
+            if hands:
+                codes = finger_states.pack(finger_states.fingers_up(np.array(hands)))
+                key = finger_states.code_to_key(codes[0])
+        with profiler.stage("simulate"):
+            particles.update(hands, key, len(hands))
+        with profiler.stage("render"):
+            overlay = compositor.decay()
+            particles.draw(overlay)
+            compositor.compose(frame)
+        profiler.end_frame()
+    return profiler
+
+
+def run_day8(recording, limit, gestures=True):
+    """Catching game engine; gestures=False is the plain day8-obj-cathing-game variant."""
+    sys.path.insert(0, os.path.join(ROOT, "Day8"))
+    import catch_engine
+
+    size = (catch_engine.SCREEN_WIDTH, catch_engine.SCREEN_HEIGHT)
+    cap      = ReplayCapture(recording, loop=True)
+    detector = ReplayDetector(cap, *size)
+    classifier = catch_engine.GestureDetector() if gestures else None
+    game     = catch_engine.Game()
+    profiler = FrameProfiler(window=limit)
+
+    for _ in range(limit):
+        with profiler.stage("capture"):
+            ret, frame = read_frame(cap, size)
+        if not ret:
+            break
+        with profiler.stage("inference"):
+            hands = detector.detect(frame, 0)
+        with profiler.stage("classify"):
+            gesture = "UNKNOWN"
+            if hands:
+                game.player.update_from_hand(*hands[0][8])
+                if classifier:
+                    gesture = classifier.classify(hands[0])
+        with profiler.stage("simulate"):
+            if game.game_over:
+                game = catch_engine.Game()
+            game.step(gesture)
+        with profiler.stage("render"):
+            game.draw(frame, gesture if gestures else None)
+        profiler.end_frame()
+    return profiler
+
+
+GAMES = {
+    "day7":        run_day7,
+    "day8-oop":    run_day8,
+    "day8-script": lambda recording, limit: run_day8(recording, limit, gestures=False),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("recording", help="recording path without extension")
+    parser.add_argument("--frames", type=int, default=500, help="frames per game (recording loops)")
+    parser.add_argument("--games", default=",".join(GAMES), help="comma separated subset of " + ", ".join(GAMES))
+    args = parser.parse_args()
+
+    recording = Recording(args.recording)
+    print(f"{len(recording)} recorded frames of {recording.frame_shape}\n")
+
+    header = f"{'game':<12} | " + " | ".join(f"{s:>15}" for s in STAGES) + f" | {'total':>7} | {'fps':>7}"
+    print(header)
+    print("-" * len(header))
+    for name in args.games.split(","):
+        summary = GAMES[name](recording, args.frames).summary()
+        stats = [summary.get(s, {"mean": 0.0, "p95": 0.0}) for s in STAGES]
+        total = sum(st["mean"] for st in stats)
+        print(f"{name:<12} | " + " | ".join(f"{st['mean']:>7.3f} /{st['p95']:>6.3f}" for st in stats)
+              + f" | {total:>7.3f} | {1000 / total if total else 0:>7.1f}")
+    print("\n(mean / p95 in ms per frame)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+The Day folders are script directories, not packages: put the repo root
+(for `common`) and the folders whose modules the tests import on sys.path.
+
+Run from the repo root: python -m pytest -q tests
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for folder in ("", "Day5", "Day7", "Day8"):
+    path = os.path.join(ROOT, folder)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+SYLLABLES = ["ka", "ri", "mo", "an", "sh", "ta", "ne", "vi"]
+
+
+@pytest.fixture(params=[24, 25], ids=lambda seed: f"seed{seed}")
+def make_contacts(request):
+    """make_contacts(n): n (name, number) pairs with unique names and numbers, sorted by name."""
+    def make(n):
+        rng = random.Random(request.param)
+        names = set()
+        while len(names) < n:
+            names.add(" ".join("".join(rng.choices(SYLLABLES, k=rng.randint(1, 3))) for _ in range(2)))
+        numbers = rng.sample(range(6_000_000_000, 10_000_000_000), n)
+        return list(zip(sorted(names), map(str, numbers)))
+    return make
@@ -0,0 +1,111 @@
+"""ContactDB: number cleaning, search, delete and import dedup."""
+
+import pytest
+
+from contact_db import ContactDB, clean_number
+from contact_store import ContactStore
+
+
+@pytest.fixture
+def db():
+    db = ContactDB(":memory:")
+    yield db
+    db.close()
+
+
+@pytest.mark.parametrize("raw, number", [
+    ("9876543210", "9876543210"),
+    ("98765 43210", "9876543210"),
+    ("(987) 654-3210", "9876543210"),
+    ("+91 98765 43210", "9876543210"),
+    ("91-9876543210", "9876543210"),
+    ("0091 9876543210", "9876543210"),
+    ("09876543210", "9876543210"),
+    ("987654321", None),              # too short
+    ("+44 20 7946 0958", None),       # foreign country code
+    ("9876543210 ext 12", None),      # extension
+    ("19876543210", None),
+    ("", None),
+])
+def test_clean_number(raw, number):
+    assert clean_number(raw) == number
+
+
+@pytest.mark.parametrize("query", ["k", "ka", "kar", "an sh", "mo ta", "zzz", 'a"b'])
+def test_search_matches_contact_store(db, make_contacts, query):
+    contacts = make_contacts(1000)
+    db.add_many(contacts)
+    assert db.search(query) == ContactStore(contacts).search(query)
+
+
+def test_search_without_fts(db, make_contacts):
+    contacts = make_contacts(300)
+    db.add_many(contacts)
+    db.fts = False   # the instr() fallback of SQLite builds without FTS5 trigram
+    assert db.search("an sh") == ContactStore(contacts).search("an sh")
+
+
+def test_prefix_and_items(db, make_contacts):
+    contacts = make_contacts(300)
+    db.add_many(reversed(contacts))
+    assert list(db.items()) == sorted(contacts)
+    assert db.prefix("ka") == ContactStore(contacts).prefix("ka")
+
+
+def test_delete_removes_from_search(db, make_contacts):
+    contacts = make_contacts(300)
+    db.add_many(contacts)
+    name, number = contacts[5]
+    assert db.remove(name) == number
+    assert name not in db
+    assert not db.has_number(number)
+    assert name not in db.search(name)
+    with pytest.raises(KeyError):
+        db.remove(name)
+    db.add(name, number)
+    assert name in db.search(name)
+
+
+def test_add_rejects_taken_name_and_number(db):
+    db.add("ada", "9876543210")
+    with pytest.raises(ValueError):
+        db.add("ada", "9876543211")
+    with pytest.raises(ValueError):
+        db.add("bob", "9876543210")
+
+
+ROWS = [("Ada  Lovelace", "+91 98765 43210"),
+        ("ada lovelace", "9876543211"),      # same name after normalizing
+        ("Bob", "098765-43210"),             # same number after cleaning
+        ("Cy", "+44 20 7946 0958"),          # rejected number
+        ("R2D2", "9876543212"),              # rejected name
+        ("Di", "9876543213")]
+
+
+@pytest.mark.parametrize("batch", [100, 2], ids=["one batch", "bulk"])
+def test_import_rows_dedups_and_counts_skipped(db, batch):
+    db.add("di", "9876543299")   # already in the book
+    added, skipped = db.import_rows(ROWS, batch=batch)
+    assert (added, skipped) == (1, 5)
+    assert list(db.items()) == [("ada lovelace", "9876543210"), ("di", "9876543299")]
+    assert db.search("love") == ["ada lovelace"]
+
+
+def test_bulk_import_matches_store(db, make_contacts):
+    contacts = make_contacts(2000)
+    rows = [(name.upper(), "+91 " + number) for name, number in contacts]
+    assert db.import_rows(rows + rows[:10], batch=500) == (2000, 10)
+    assert list(db.items()) == sorted(contacts)
+    assert db.search("an sh") == ContactStore(contacts).search("an sh")
+    assert db.import_rows(rows, batch=500) == (0, 2000)   # everything is a duplicate now
+
+
+def test_import_csv_and_vcard(db, tmp_path):
+    csv_path = tmp_path / "book.csv"
+    csv_path.write_text("Phone,Name\n+91 9876543210,Ada\n9876543211,Bob\n", encoding="utf-8")
+    vcf_path = tmp_path / "book.vcf"
+    vcf_path.write_text("BEGIN:VCARD\nFN:Cy\nTEL;TYPE=CELL:98765\n 43212\nTEL:9876543299\nEND:VCARD\n"
+                        "BEGIN:VCARD\nFN:Ada\nTEL:9876543213\nEND:VCARD\n", encoding="utf-8")
+    assert db.import_csv(str(csv_path)) == (2, 0)
+    assert db.import_vcard(str(vcf_path)) == (1, 1)   # folded first TEL; Ada is a duplicate
+    assert dict(db.items()) == {"ada": "9876543210", "bob": "9876543211", "cy": "9876543212"}
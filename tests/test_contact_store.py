@@ -0,0 +1,74 @@
+"""ContactStore against plain scans over a dict."""
+
+import pytest
+
+from contact_store import ContactStore, normalize_name
+
+
+def scan(book, query):
+    return sorted(name for name in book if query in name)
+
+
+def test_normalize_name():
+    assert normalize_name("  Ada   LOVELACE ") == "ada lovelace"
+
+
+@pytest.mark.parametrize("query", ["k", "ka", "kar", "an sh", "mo ta", "zzz", "a k", "rimo"])
+def test_search_matches_a_scan(make_contacts, query):
+    contacts = make_contacts(2000)
+    store = ContactStore(contacts)
+    assert store.search(query) == scan(dict(contacts), query)
+
+
+def test_prefix_and_items_are_sorted(make_contacts):
+    contacts = make_contacts(500)
+    store = ContactStore(reversed(contacts))
+    assert list(store.items()) == sorted(contacts)
+    assert store.prefix("ka") == [name for name, _ in sorted(contacts) if name.startswith("ka")]
+
+
+def test_add_rejects_taken_name_and_number():
+    store = ContactStore([("ada", "9876543210")])
+    with pytest.raises(ValueError):
+        store.add("ada", "9876543211")
+    with pytest.raises(ValueError):
+        store.add("bob", "9876543210")
+    store.add("bob", "9876543211")
+    assert store.name_for_number("9876543211") == "bob"
+
+
+def test_add_many_skips_duplicates():
+    store = ContactStore([("ada", "9876543210")])
+    added = store.add_many([("ada", "1111111111"), ("bob", "9876543210"),
+                            ("cy", "2222222222"), ("cy", "3333333333")])
+    assert added == 1
+    assert list(store.items()) == [("ada", "9876543210"), ("cy", "2222222222")]
+
+
+def test_delete_removes_from_every_index(make_contacts):
+    contacts = make_contacts(200)
+    store = ContactStore(contacts)
+    name, number = contacts[10]
+    assert store.remove(name) == number
+    assert name not in store
+    assert not store.has_number(number)
+    assert name not in store.search(name)
+    assert name not in store.prefix(name)
+    assert len(store) == len(contacts) - 1
+    with pytest.raises(KeyError):
+        store.remove(name)
+    store.add(name, number)   # name and number are free again
+    assert store.search(name) == scan(dict(contacts), name)
+
+
+def test_search_after_mass_delete_and_reindex(make_contacts):
+    contacts = make_contacts(5000)
+    store = ContactStore(contacts)
+    book = dict(contacts)
+    for i, (name, _) in enumerate(contacts):
+        if i % 5:   # enough tombstones to rebuild the index
+            store.remove(name)
+            del book[name]
+    assert len(store._by_id) < len(contacts)   # the index was rebuilt without tombstones
+    for query in ["ka", "an sh", "mo", "vi ne"]:
+        assert store.search(query) == scan(book, query)
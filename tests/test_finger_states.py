@@ -0,0 +1,122 @@
+"""finger_states against the per-hand if/elif code it replaced."""
+
+from collections import namedtuple
+from itertools import product
+
+import numpy as np
+import pytest
+
+from common import finger_states
+from catch_engine import GestureDetector
+
+Landmark = namedtuple("Landmark", ["x", "y"])
+
+
+# ── the original implementations, kept verbatim as the reference ──
+def old_get_fingers_up(hand_points):
+    """Returns tuple of 5 booleans: (thumb, index, middle, ring, pinky)"""
+    if len(hand_points) < 21:
+        return (False, False, False, False, False)
+
+    THRESHOLD = 12
+
+    # Thumb (horizontal check)
+    wrist_x   = hand_points[0][0]
+    thumb_tip = hand_points[4][0]
+    thumb_mcp = hand_points[2][0]
+    thumb_up  = abs(thumb_tip - wrist_x) > abs(thumb_mcp - wrist_x)
+
+    # Other 4 fingers (vertical check)
+    other = []
+    for tip_id, pip_id in [(8, 6), (12, 10), (16, 14), (20, 18)]:
+        other.append((hand_points[pip_id][1] - hand_points[tip_id][1]) > THRESHOLD)
+
+    return (thumb_up, other[0], other[1], other[2], other[3])
+
+
+def old_classify(hand_landmarks):
+    # tip.y < base.y means finger is extended (higher on screen)
+    def is_extended(tip_i, base_i):
+        return hand_landmarks[tip_i].y < hand_landmarks[base_i].y
+
+    thumb_ext = is_extended(4, 2)   # approximate base for thumb
+    index_ext = is_extended(8, 5)
+    middle_ext = is_extended(12, 9)
+    ring_ext = is_extended(16, 13)
+    pinky_ext = is_extended(20, 17)
+
+    extended_count = sum([thumb_ext, index_ext, middle_ext, ring_ext, pinky_ext])
+
+    # FIST: none or only one extended
+    if extended_count <= 1:
+        return "FIST"
+
+    # TWO FINGERS: index + middle extended, ring & pinky folded
+    if index_ext and middle_ext and not ring_ext and not pinky_ext:
+        return "TWO_FINGERS"
+
+    # OPEN: most fingers extended
+    if extended_count >= 4:
+        return "OPEN"
+
+    return "UNKNOWN"
+
+
+@pytest.fixture
+def hands():
+    """Integer pixel hands clustered so that margins land on and around the 12 px line."""
+    rng = np.random.default_rng(8)
+    points = rng.integers(300, 340, size=(2000, 21, 2))
+    points[:, 0] = rng.integers(280, 360, size=(2000, 2))
+    return points
+
+
+def test_fingers_up_matches_old_rule(hands):
+    expected = np.array([old_get_fingers_up(hand.tolist()) for hand in hands])
+    np.testing.assert_array_equal(finger_states.fingers_up(hands), expected)
+
+
+def test_fingers_up_on_the_threshold():
+    hand = np.zeros((21, 2), dtype=np.int32)
+    hand[6, 1], hand[8, 1] = 112, 100     # exactly 12 px: still down
+    hand[10, 1], hand[12, 1] = 113, 100   # 13 px: up
+    assert tuple(finger_states.fingers_up(hand)) == old_get_fingers_up(hand.tolist())
+    assert finger_states.fingers_up(hand)[1:3].tolist() == [False, True]
+
+
+def test_states_from_margins_is_fingers_up(hands):
+    margins = finger_states.finger_margins(hands)
+    for threshold in (0, 12, 30):
+        np.testing.assert_array_equal(finger_states.states_from_margins(margins, threshold),
+                                      finger_states.fingers_up(hands, threshold))
+
+
+def test_pack_matches_key_to_code():
+    keys = np.array(list(product([False, True], repeat=5)))
+    codes = finger_states.pack(keys)
+    assert codes.dtype == np.uint8
+    assert codes.tolist() == [finger_states.key_to_code(key) for key in keys.tolist()]
+    assert sorted(codes.tolist()) == list(range(finger_states.NUM_CODES))
+
+
+def test_code_to_key_round_trip():
+    for code in range(finger_states.NUM_CODES):
+        key = finger_states.code_to_key(code)
+        assert finger_states.key_to_code(key) == code
+        assert finger_states.pack(np.array(key)) == code
+
+
+def test_build_table_indexed_by_code():
+    table = finger_states.build_table(lambda key: key)
+    assert len(table) == finger_states.NUM_CODES
+    for code, key in enumerate(table):
+        assert finger_states.key_to_code(key) == code
+
+
+def test_gesture_table_matches_old_classify(hands):
+    detector = GestureDetector()
+    for hand in hands[:500]:
+        landmarks = [Landmark(x, y) for x, y in hand.tolist()]
+        assert detector.classify(hand) == old_classify(landmarks)
+    batch = detector.classify_batch(hands)
+    assert batch.tolist() == [old_classify([Landmark(x, y) for x, y in hand.tolist()]) for hand in hands]
@@ -0,0 +1,45 @@
+"""GameClock fixed-timestep stepping."""
+
+from catch_engine import GameClock
+
+
+def test_whole_steps_and_remainder():
+    clock = GameClock(step_hz=4, max_steps=5)   # dt = 0.25 s, exact in binary
+    assert clock.advance(0.625) == 2
+    assert clock.accumulator == 0.125
+    assert clock.alpha == 0.5
+    assert clock.advance(0.125) == 1   # the remainder adds up to a step
+    assert clock.accumulator == 0.0
+    assert clock.steps == 3
+
+
+def test_steps_do_not_depend_on_frame_rate():
+    fast, slow = GameClock(step_hz=30), GameClock(step_hz=30)
+    for _ in range(120):
+        fast.advance(1 / 60)
+    for _ in range(40):
+        slow.advance(1 / 20)
+    assert fast.steps == slow.steps == 60
+
+
+def test_time_scale():
+    clock = GameClock(step_hz=4)
+    clock.time_scale = 0.0   # paused
+    assert clock.advance(1.0) == 0
+    assert clock.alpha == 0.0
+    clock.time_scale = 0.5   # slow motion
+    assert clock.advance(1.0) == 2
+    assert clock.steps == 2
+
+
+def test_long_stall_drops_the_backlog():
+    clock = GameClock(step_hz=30, max_steps=5)
+    assert clock.advance(2.0) == 5
+    assert clock.accumulator == 0.0
+    assert clock.advance(1 / 30 + 1e-9) == 1
+
+
+def test_alpha_is_capped():
+    clock = GameClock(step_hz=4)
+    clock.accumulator = 0.5   # e.g. set by hand before the next advance()
+    assert clock.alpha == 1.0
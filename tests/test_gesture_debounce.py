@@ -0,0 +1,95 @@
+"""GestureDebouncer: hysteresis, hold time and hand matching."""
+
+import numpy as np
+
+from common import finger_states
+from common.gesture_debounce import GestureDebouncer
+
+INDEX_ONLY = finger_states.key_to_code((False, True, False, False, False))
+
+
+def hand(index_margin, wrist_x=300.0):
+    """A hand with the thumb folded, index `index_margin` px above its pip, the rest down."""
+    points = np.zeros((21, 2))
+    points[:, 0] = wrist_x
+    points[:, 1] = 400.0
+    points[finger_states.PIPS, 1] = 350.0
+    points[finger_states.TIPS, 1] = 380.0   # 30 px below the pip: down
+    points[8, 1] = 350.0 - index_margin
+    return points.tolist()
+
+
+def debouncer(events, hold=0.1):
+    return GestureDebouncer(up_px=18, down_px=6, hold=hold, on_change=lambda *event: events.append(event))
+
+
+def test_new_hand_is_confirmed_at_once():
+    events = []
+    codes = debouncer(events).update(0.0, [hand(40)])
+    assert codes.tolist() == [INDEX_ONLY]
+    assert events == [(0, None, INDEX_ONLY, 0.0)]
+
+
+def test_hysteresis_band_keeps_the_last_state():
+    events = []
+    d = debouncer(events, hold=0.0)
+    d.update(0.0, [hand(40)])
+    for t, margin in enumerate([12, 8, 17, 7], start=1):   # between down_px and up_px
+        assert d.update(t, [hand(margin)]).tolist() == [INDEX_ONLY]
+    assert d.update(5, [hand(5)]).tolist() == [0]           # clearly down
+    for t, margin in enumerate([7, 12, 17], start=6):
+        assert d.update(t, [hand(margin)]).tolist() == [0]
+    assert d.update(9, [hand(19)]).tolist() == [INDEX_ONLY]  # clearly up
+    assert [event[1:3] for event in events[1:]] == [(INDEX_ONLY, 0), (0, INDEX_ONLY)]
+
+
+def test_plain_rule_flips_are_counted_but_not_confirmed():
+    d = debouncer([], hold=0.0)
+    for t in range(20):
+        d.update(t * 0.05, [hand(11 if t % 2 else 13)])   # across the 12 px line every frame
+    plain, confirmed = d.rates()
+    assert plain > 0
+    assert confirmed == 0
+
+
+def test_hold_delays_confirmation():
+    events = []
+    d = debouncer(events, hold=0.5)
+    d.update(0.0, [hand(40)])
+    assert d.update(0.25, [hand(0)]).tolist() == [INDEX_ONLY]   # candidate, not held yet
+    assert d.update(0.5, [hand(0)]).tolist() == [INDEX_ONLY]    # 0.25 s held
+    assert d.update(0.75, [hand(0)]).tolist() == [0]            # 0.5 s held
+    assert events[-1] == (0, INDEX_ONLY, 0, 0.75)
+
+
+def test_short_blip_is_ignored():
+    events = []
+    d = debouncer(events, hold=0.1)
+    d.update(0.0, [hand(40)])
+    d.update(0.05, [hand(0)])
+    d.update(0.10, [hand(40)])   # back before the hold ran out
+    d.update(0.30, [hand(40)])
+    assert len(events) == 1
+    assert not d.changed
+
+
+def test_swapped_hands_keep_their_state():
+    events = []
+    d = debouncer(events)
+    left, right = hand(40, wrist_x=200), hand(0, wrist_x=900)
+    assert d.update(0.0, [left, right]).tolist() == [INDEX_ONLY, 0]
+    assert d.update(0.5, [right, left]).tolist() == [0, INDEX_ONLY]
+    assert d.changed   # per-hand keys have to follow the new order
+    assert d.update(1.0, [right, left]).tolist() == [0, INDEX_ONLY]
+    assert not d.changed
+    assert len(events) == 2   # the two hands appearing, nothing after
+
+
+def test_hands_leaving_and_returning():
+    events = []
+    d = debouncer(events)
+    d.update(0.0, [hand(40)])
+    assert d.update(0.1, []).tolist() == []
+    assert d.changed
+    d.update(0.2, [hand(0)])
+    assert events[-1] == (0, None, 0, 0.2)   # a new hand, not a transition
@@ -0,0 +1,52 @@
+"""TextCache draws the same pixels as cv2.putText."""
+
+import cv2
+import numpy as np
+import pytest
+
+from common.hud import FONT, TextCache, hard_edged
+
+
+def background(seed=21):
+    return np.random.default_rng(seed).integers(0, 256, size=(120, 320, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("text, org, scale, color, thickness", [
+    ("FIST", (10, 40), 1.0, (0, 255, 255), 2),
+    ("Particles spiral inward", (5, 100), 0.5, (255, 255, 255), 1),
+    ("fps: 29.7 | g/j ~", (20, 70), 0.6, (80, 200, 255), 1),
+    ("edge", (-15, 8), 0.8, (0, 0, 255), 2),      # clipped on the left and top
+    ("edge", (290, 118), 0.8, (255, 0, 0), 1),    # clipped on the right and bottom
+    ("off", (500, 500), 0.5, (255, 255, 255), 1),  # outside the frame
+    (" ", (10, 40), 1.0, (255, 255, 255), 1),     # nothing to draw
+])
+def test_put_matches_put_text(text, org, scale, color, thickness):
+    expected = background()
+    cv2.putText(expected, text, org, FONT, scale, color, thickness)
+    frame = background()
+    TextCache().put(frame, text, org, scale, color, thickness)
+    np.testing.assert_array_equal(frame, expected)
+
+
+@pytest.mark.skipif(not hard_edged(), reason="antialiased putText (OpenCV 5) is not cached")
+def test_cached_sprite_is_reused_and_still_exact():
+    cache = TextCache()
+    for seed in range(3):   # a new camera frame under the same HUD text
+        expected = background(seed)
+        cv2.putText(expected, "OPEN HAND", (10, 50), FONT, 0.9, (0, 255, 255), 2)
+        frame = background(seed)
+        cache.put(frame, "OPEN HAND", (10, 50), 0.9, (0, 255, 255), 2)
+        np.testing.assert_array_equal(frame, expected)
+    assert (cache.misses, cache.hits) == (1, 2)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TextCache(max_entries=2)
+    cache.cached = True   # the sprite path, whichever renderer this OpenCV has
+    frame = background()
+    for text in ["a", "b", "a", "c"]:   # "b" is the least recently used when "c" arrives
+        cache.put(frame, text, (10, 40), 1.0, (255, 255, 255))
+    cache.put(frame, "a", (10, 40), 1.0, (255, 255, 255))
+    assert cache.hits == 2
+    cache.put(frame, "b", (10, 40), 1.0, (255, 255, 255))
+    assert cache.misses == 4
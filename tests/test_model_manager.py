@@ -0,0 +1,39 @@
+"""ensure_model: pinned checksum and trust on first use for a local model."""
+
+import hashlib
+
+import pytest
+
+from common import model_manager
+from common.model_manager import ensure_model
+
+
+@pytest.fixture
+def model(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(model_manager, "download", lambda *args: pytest.fail("should not download"))
+    path = tmp_path / "hand_landmarker.task"
+    path.write_bytes(b"model v1")
+    return path
+
+
+def test_local_file_matching_the_pin(model):
+    digest = hashlib.sha256(b"model v1").hexdigest()
+    assert ensure_model(sha256=digest, local_path=str(model)) == str(model)
+    assert not (model.parent / "hand_landmarker.task.sha256").exists()
+
+
+def test_local_file_not_matching_the_pin_is_trusted_once(model):
+    assert ensure_model(sha256="0" * 64, local_path=str(model)) == str(model)
+    recorded = (model.parent / "hand_landmarker.task.sha256").read_text()
+    assert recorded == hashlib.sha256(b"model v1").hexdigest()
+    assert ensure_model(sha256="0" * 64, local_path=str(model)) == str(model)
+
+    model.write_bytes(b"model v2")   # changed after it was trusted
+    with pytest.raises(ValueError):
+        ensure_model(sha256="0" * 64, local_path=str(model))
+
+
+def test_no_pin_without_trust_on_first_use(model):
+    with pytest.raises(ValueError):
+        ensure_model(sha256=None, local_path=str(model))
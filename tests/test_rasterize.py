@@ -0,0 +1,63 @@
+"""rasterize against np.maximum.at / np.add.at, including heavy overlap."""
+
+import numpy as np
+import pytest
+
+from particle_engine import PALETTE, STAMP_DX, STAMP_DY, rasterize
+
+WIDTH, HEIGHT = 160, 90
+
+
+def reference(frame, x, y, palette, life, blend):
+    """The straightforward ufunc.at version, with a sum that cannot wrap."""
+    colors = (PALETTE[palette] * np.clip(life, 0.0, 1.0)[:, None]).astype(np.uint8)
+    xs = (x.astype(np.int32)[:, None] + STAMP_DX).ravel()
+    ys = (y.astype(np.int32)[:, None] + STAMP_DY).ravel()
+    colors = np.repeat(colors, len(STAMP_DX), axis=0)
+    inside = (xs >= 0) & (xs < WIDTH) & (ys >= 0) & (ys < HEIGHT)
+    idx = ys[inside] * WIDTH + xs[inside]
+    flat = frame.reshape(-1, 3)
+    if blend == "max":
+        np.maximum.at(flat, idx, colors[inside])
+    else:
+        total = np.zeros(flat.shape, dtype=np.int64)
+        np.add.at(total, idx, colors[inside])
+        flat[:] = np.minimum(total + flat, 255)
+
+
+def particles(n, seed=2):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(-5, WIDTH + 5, n).astype(np.float32)   # some fall off every edge
+    y = rng.uniform(-5, HEIGHT + 5, n).astype(np.float32)
+    x[:1000], y[:1000] = 80.5, 45.5   # 1000 hits on one pixel
+    palette = rng.integers(0, len(PALETTE), n, dtype=np.uint16)
+    life = rng.uniform(-0.2, 1.2, n).astype(np.float32)
+    return x, y, palette, life
+
+
+@pytest.mark.parametrize("blend", ["max", "add"])
+def test_matches_ufunc_at(blend):
+    frame = np.random.default_rng(0).integers(0, 256, (HEIGHT, WIDTH, 3), dtype=np.uint8)
+    expected = frame.copy()
+    reference(expected, *particles(5000), blend)
+    rasterize(frame, *particles(5000), blend=blend)
+    np.testing.assert_array_equal(frame, expected)
+
+
+def test_add_saturates_instead_of_wrapping():
+    frame = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    n = 267   # 267 * 246 = 65682, which a uint16 sum wraps to 146
+    x = np.full(n, 80.0, dtype=np.float32)
+    palette = np.zeros(n, dtype=np.uint16)
+    assert PALETTE[0].max() == 246
+    rasterize(frame, x, x - 35, palette, np.ones(n, dtype=np.float32), blend="add")
+    assert (frame[45, 80] == 255).all()
+
+
+def test_nothing_on_screen_and_unknown_blend():
+    frame = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    far = np.full(3, -100, dtype=np.float32)
+    rasterize(frame, far, far, np.zeros(3, dtype=np.uint16), np.ones(3, dtype=np.float32))
+    assert not frame.any()
+    with pytest.raises(ValueError):
+        rasterize(frame, far, far, np.zeros(3, dtype=np.uint16), np.ones(3, dtype=np.float32), blend="mix")